@@ -1 +1,21 @@
 from django.contrib import admin
+
+from .models import DailyExpenseRollup, MonthlyExpenseRollup
+
+@admin.register(DailyExpenseRollup)
+class DailyExpenseRollupAdmin(admin.ModelAdmin):
+
+    list_display = ["family", "day", "category_id", "user_id", "total", "count"]
+    list_filter = ["day"]
+    search_fields = ["family__name"]
+    raw_id_fields = ["family"]
+    date_hierarchy = "day"
+
+@admin.register(MonthlyExpenseRollup)
+class MonthlyExpenseRollupAdmin(admin.ModelAdmin):
+
+    list_display = ["family", "month", "category_id", "user_id", "total", "count"]
+    list_filter = ["month"]
+    search_fields = ["family__name"]
+    raw_id_fields = ["family"]
+    date_hierarchy = "month"
@@ -1,7 +1,121 @@
-from ninja import Router
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from django.db.models import Sum
+from django.utils import timezone
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from apps.categories.models import Category
+from apps.families.permissions import require_family_permission
+from apps.users.api import auth
+from household_manager.db_router import use_replica
+
+from .engine import get_insights
+from .models import MonthlyExpenseRollup
+from .rollups import month_start, next_month, sum_rollups
+from .schemas import CategoryBreakdownSchema, InsightsSchema, SummarySchema, TrendsSchema
+
 router = Router()
 
-@router.get("/")
-def get_analytics(request):
 
-    return {"message": "Analytics API - coming soon"}
+def _resolve_period(date_from: Optional[date], date_to: Optional[date]) -> tuple[date, date]:
+    today = timezone.localdate()
+    date_from = date_from or month_start(today)
+    date_to = date_to or today + timedelta(days=1)
+
+    if date_from >= date_to:
+        raise HttpError(400, "date_from must be before date_to")
+
+    return date_from, date_to
+
+
+@router.get("/family/{family_id}/summary", response=SummarySchema, auth=auth)
+@require_family_permission()
+@use_replica
+def get_summary(request, family_id: UUID, date_from: Optional[date] = None, date_to: Optional[date] = None):
+    date_from, date_to = _resolve_period(date_from, date_to)
+
+    rows = sum_rollups(family_id, date_from, date_to)
+    total = rows[0]["total"] if rows else Decimal(0)
+    count = rows[0]["count"] if rows else 0
+    days = (date_to - date_from).days
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "total": total,
+        "count": count,
+        "daily_average": (total / days).quantize(Decimal("0.01")),
+    }
+
+
+@router.get("/family/{family_id}/categories", response=list[CategoryBreakdownSchema], auth=auth)
+@require_family_permission()
+@use_replica
+def get_category_breakdown(
+    request,
+    family_id: UUID,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    date_from, date_to = _resolve_period(date_from, date_to)
+
+    rows = sorted(sum_rollups(family_id, date_from, date_to, ("category_id",)), key=lambda row: -row["total"])
+    names = dict(
+        Category.objects.filter(id__in=[row["category_id"] for row in rows if row["category_id"]])
+        .values_list("id", "name")
+    )
+    grand_total = sum(row["total"] for row in rows)
+
+    return [
+        {
+            "category_id": row["category_id"],
+            "category_name": names.get(row["category_id"]),
+            "total": row["total"],
+            "count": row["count"],
+            "share": float(row["total"] / grand_total) if grand_total else 0.0,
+        }
+        for row in rows
+    ]
+
+
+@router.get("/family/{family_id}/trends", response=TrendsSchema, auth=auth)
+@require_family_permission()
+@use_replica
+def get_trends(request, family_id: UUID, months: int = Query(12, ge=1, le=60)):
+    months_list = []
+    month = month_start(timezone.localdate())
+    for _ in range(months):
+        months_list.append(month)
+        month = month_start(month - timedelta(days=1))
+    months_list.reverse()
+
+    totals = {
+        row["month"]: row
+        for row in MonthlyExpenseRollup.objects.filter(
+            family_id=family_id, month__gte=months_list[0], month__lt=next_month(months_list[-1])
+        )
+        .order_by()
+        .values("month")
+        .annotate(total=Sum("total"), count=Sum("count"))
+    }
+
+    return {
+        "points": [
+            {
+                "month": month,
+                "total": totals[month]["total"] if month in totals else Decimal(0),
+                "count": totals[month]["count"] if month in totals else 0,
+            }
+            for month in months_list
+        ]
+    }
+
+
+@router.get("/family/{family_id}/insights", response=InsightsSchema, auth=auth)
+@require_family_permission()
+def get_family_insights(request, family_id: UUID, months: int = Query(24, ge=1, le=120)):
+    return get_insights(family_id, months)
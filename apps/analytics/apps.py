@@ -4,3 +4,7 @@ class AnalyticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.analytics"
     verbose_name = "Analytics"
+
+    def ready(self):
+
+        from . import signals  # noqa: F401
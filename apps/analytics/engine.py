@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.expenses.models import Expense
+from apps.families.versions import get_data_version
+
+INSIGHTS_CACHE_KEY = "analytics:insights:{family_id}:{version}:{day}:{months}"
+DAILY_POINTS = 90
+FORECAST_WINDOW = 12
+
+
+def load_expense_frame(family_id, months: int) -> pd.DataFrame:
+    since = timezone.now() - timedelta(days=31 * months)
+    rows = list(
+        Expense.objects.filter(family_id=family_id, spent_at__gte=since)
+        .order_by()
+        .values_list("spent_at", "amount", "category_id")
+    )
+
+    frame = pd.DataFrame.from_records(rows, columns=["spent_at", "amount", "category_id"])
+    frame["spent_at"] = pd.to_datetime(frame["spent_at"], utc=True).dt.tz_convert(settings.TIME_ZONE)
+    frame["amount"] = frame["amount"].astype("float64")
+    frame["category_id"] = frame["category_id"].astype("string")
+    return frame
+
+
+def _daily_series(frame: pd.DataFrame) -> pd.DataFrame:
+    daily = frame.set_index("spent_at")["amount"].resample("D").sum()
+    return pd.DataFrame(
+        {
+            "total": daily,
+            "ma7": daily.rolling(7, min_periods=1).mean(),
+            "ma30": daily.rolling(30, min_periods=1).mean(),
+        }
+    )
+
+
+def _monthly_series(frame: pd.DataFrame) -> pd.DataFrame:
+    monthly = frame.set_index("spent_at")["amount"].resample("MS").sum()
+    return pd.DataFrame({"total": monthly, "mom_change": monthly.pct_change().replace([np.inf, -np.inf], np.nan)})
+
+
+def _category_percentiles(frame: pd.DataFrame) -> pd.DataFrame:
+    grouped = frame.fillna({"category_id": ""}).groupby("category_id")["amount"]
+    percentiles = grouped.quantile([0.5, 0.9]).unstack()
+    percentiles.columns = ["p50", "p90"]
+    percentiles["count"] = grouped.size()
+    percentiles["total"] = grouped.sum()
+    return percentiles.sort_values("total", ascending=False)
+
+
+def _forecast(monthly: pd.DataFrame) -> dict:
+    now = timezone.localtime()
+    current_month = pd.Timestamp(now.date().replace(day=1), tz=settings.TIME_ZONE)
+
+    history = monthly.loc[monthly.index < current_month, "total"].tail(FORECAST_WINDOW).to_numpy()
+    if len(history) >= 2:
+        slope, intercept = np.polyfit(np.arange(len(history)), history, 1)
+        next_month = max(float(slope * (len(history) + 1) + intercept), 0.0)
+    else:
+        next_month = float(history[-1]) if len(history) else 0.0
+
+    spent_this_month = float(monthly["total"].get(current_month, 0.0))
+    days_in_month = pd.Timestamp(now.date()).days_in_month
+    current_month_projection = spent_this_month / now.day * days_in_month
+
+    return {
+        "next_month": round(next_month, 2),
+        "current_month_projection": round(current_month_projection, 2),
+    }
+
+
+def _nan_to_none(value):
+    return None if pd.isna(value) else round(float(value), 4)
+
+
+def compute_insights(family_id, months: int = 24) -> dict:
+    frame = load_expense_frame(family_id, months)
+    if frame.empty:
+        return {
+            "daily": [],
+            "monthly": [],
+            "category_percentiles": [],
+            "forecast": {"next_month": 0.0, "current_month_projection": 0.0},
+        }
+
+    daily = _daily_series(frame).tail(DAILY_POINTS)
+    monthly = _monthly_series(frame)
+    percentiles = _category_percentiles(frame)
+
+    return {
+        "daily": [
+            {"date": day.date(), "total": round(total, 2), "ma7": round(ma7, 2), "ma30": round(ma30, 2)}
+            for day, total, ma7, ma30 in zip(daily.index, daily["total"], daily["ma7"], daily["ma30"])
+        ],
+        "monthly": [
+            {"month": month.date(), "total": round(total, 2), "mom_change": _nan_to_none(change)}
+            for month, total, change in zip(monthly.index, monthly["total"], monthly["mom_change"])
+        ],
+        "category_percentiles": [
+            {
+                "category_id": category_id or None,
+                "p50": round(p50, 2),
+                "p90": round(p90, 2),
+                "count": int(count),
+                "total": round(total, 2),
+            }
+            for category_id, p50, p90, count, total in zip(
+                percentiles.index,
+                percentiles["p50"],
+                percentiles["p90"],
+                percentiles["count"],
+                percentiles["total"],
+            )
+        ],
+        "forecast": _forecast(monthly),
+    }
+
+
+def get_insights(family_id, months: int = 24) -> dict:
+    key = INSIGHTS_CACHE_KEY.format(
+        family_id=family_id,
+        version=get_data_version(family_id),
+        day=timezone.localdate().isoformat(),
+        months=months,
+    )
+
+    insights = cache.get(key)
+    if insights is None:
+        insights = compute_insights(family_id, months)
+        cache.set(key, insights, settings.ANALYTICS_INSIGHTS_CACHE_TIMEOUT)
+
+    return insights
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.analytics.models import DailyExpenseRollup, MonthlyExpenseRollup
+from apps.analytics.rollups import apply_expenses
+from apps.expenses.models import Expense
+from apps.families.models import Family
+
+
+class Command(BaseCommand):
+    help = "Rebuild daily and monthly expense rollups from the raw expenses table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--family", dest="family_ids", action="append", default=[])
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        family_ids = options["family_ids"] or Family.objects.values_list("id", flat=True)
+
+        for family_id in family_ids:
+            with transaction.atomic():
+                DailyExpenseRollup.objects.filter(family_id=family_id).delete()
+                MonthlyExpenseRollup.objects.filter(family_id=family_id).delete()
+
+                expenses = Expense.objects.filter(family_id=family_id).only(
+                    "family_id", "category_id", "user_id", "spent_at", "amount"
+                )
+                chunk = []
+                for expense in expenses.iterator(chunk_size=options["chunk_size"]):
+                    chunk.append(expense)
+                    if len(chunk) >= options["chunk_size"]:
+                        apply_expenses(added=chunk)
+                        chunk = []
+                apply_expenses(added=chunk)
+
+            self.stdout.write(f"Rebuilt rollups for family {family_id}")
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('families', '0003_family_active_members_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyExpenseRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='day')),
+                ('category_id', models.UUIDField(blank=True, null=True, verbose_name='category')),
+                ('user_id', models.UUIDField(blank=True, null=True, verbose_name='member')),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='total')),
+                ('count', models.IntegerField(default=0, verbose_name='expenses count')),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='families.family', verbose_name='family')),
+            ],
+            options={
+                'verbose_name': 'daily expense rollup',
+                'verbose_name_plural': 'daily expense rollups',
+                'db_table': 'analytics_daily_rollups',
+                'constraints': [models.UniqueConstraint(fields=('family', 'day', 'category_id', 'user_id'), name='uniq_daily_rollup', nulls_distinct=False)],
+            },
+        ),
+        migrations.CreateModel(
+            name='MonthlyExpenseRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='month')),
+                ('category_id', models.UUIDField(blank=True, null=True, verbose_name='category')),
+                ('user_id', models.UUIDField(blank=True, null=True, verbose_name='member')),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='total')),
+                ('count', models.IntegerField(default=0, verbose_name='expenses count')),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='families.family', verbose_name='family')),
+            ],
+            options={
+                'verbose_name': 'monthly expense rollup',
+                'verbose_name_plural': 'monthly expense rollups',
+                'db_table': 'analytics_monthly_rollups',
+                'constraints': [models.UniqueConstraint(fields=('family', 'month', 'category_id', 'user_id'), name='uniq_monthly_rollup', nulls_distinct=False)],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.families.models import Family
+
+class DailyExpenseRollup(models.Model):
+
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+        verbose_name=_("family"),
+    )
+    day = models.DateField(_("day"))
+    category_id = models.UUIDField(_("category"), null=True, blank=True)
+    user_id = models.UUIDField(_("member"), null=True, blank=True)
+    total = models.DecimalField(_("total"), max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(_("expenses count"), default=0)
+
+    class Meta:
+        db_table = "analytics_daily_rollups"
+        verbose_name = _("daily expense rollup")
+        verbose_name_plural = _("daily expense rollups")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["family", "day", "category_id", "user_id"],
+                name="uniq_daily_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.family_id} {self.day}: {self.total}"
+
+class MonthlyExpenseRollup(models.Model):
+
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="monthly_rollups",
+        verbose_name=_("family"),
+    )
+    month = models.DateField(_("month"))
+    category_id = models.UUIDField(_("category"), null=True, blank=True)
+    user_id = models.UUIDField(_("member"), null=True, blank=True)
+    total = models.DecimalField(_("total"), max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(_("expenses count"), default=0)
+
+    class Meta:
+        db_table = "analytics_monthly_rollups"
+        verbose_name = _("monthly expense rollup")
+        verbose_name_plural = _("monthly expense rollups")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["family", "month", "category_id", "user_id"],
+                name="uniq_monthly_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.family_id} {self.month:%Y-%m}: {self.total}"
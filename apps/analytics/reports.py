@@ -0,0 +1,42 @@
+from datetime import date
+
+from django.core.cache import cache
+
+from apps.categories.models import Category
+
+from .rollups import next_month, sum_rollups
+
+MONTHLY_REPORT_KEY = "analytics:monthly_report:{family_id}:{month:%Y-%m}"
+MONTHLY_REPORT_TIMEOUT = 40 * 24 * 60 * 60
+
+
+def build_monthly_report(family_id, month: date) -> dict:
+    by_category = sorted(
+        sum_rollups(family_id, month, next_month(month), ("category_id",)),
+        key=lambda row: -row["total"],
+    )
+    names = dict(
+        Category.objects.filter(id__in=[row["category_id"] for row in by_category if row["category_id"]])
+        .values_list("id", "name")
+    )
+
+    return {
+        "family_id": str(family_id),
+        "month": month.isoformat(),
+        "total": str(sum(row["total"] for row in by_category)),
+        "count": sum(row["count"] for row in by_category),
+        "top_categories": [
+            {"name": names.get(row["category_id"]), "total": str(row["total"])}
+            for row in by_category[:5]
+        ],
+    }
+
+
+def store_monthly_report(family_id, month: date) -> dict:
+    report = build_monthly_report(family_id, month)
+    cache.set(MONTHLY_REPORT_KEY.format(family_id=family_id, month=month), report, MONTHLY_REPORT_TIMEOUT)
+    return report
+
+
+def get_monthly_report(family_id, month: date):
+    return cache.get(MONTHLY_REPORT_KEY.format(family_id=family_id, month=month))
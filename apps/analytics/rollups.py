@@ -0,0 +1,127 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import connection
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from .models import DailyExpenseRollup, MonthlyExpenseRollup
+
+UPSERT_BATCH_SIZE = 1000
+
+_UPSERT_SQL = """
+    INSERT INTO {table} (family_id, {period}, category_id, user_id, total, count)
+    VALUES {values}
+    ON CONFLICT (family_id, {period}, category_id, user_id) DO UPDATE
+    SET total = {table}.total + EXCLUDED.total,
+        count = {table}.count + EXCLUDED.count
+"""
+
+_DETACH_SQL = """
+    WITH moved AS (
+        DELETE FROM {table} WHERE {column} = %s
+        RETURNING family_id, {period}, category_id, user_id, total, count
+    )
+    INSERT INTO {table} (family_id, {period}, category_id, user_id, total, count)
+    SELECT {values} FROM moved
+    ON CONFLICT (family_id, {period}, category_id, user_id) DO UPDATE
+    SET total = {table}.total + EXCLUDED.total,
+        count = {table}.count + EXCLUDED.count
+"""
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def apply_expenses(added: Iterable = (), removed: Iterable = ()) -> None:
+    daily = defaultdict(lambda: [Decimal(0), 0])
+    monthly = defaultdict(lambda: [Decimal(0), 0])
+
+    for expenses, sign in ((added, 1), (removed, -1)):
+        for expense in expenses:
+            day = timezone.localdate(expense.spent_at)
+            for buckets, period in ((daily, day), (monthly, month_start(day))):
+                bucket = buckets[(expense.family_id, period, expense.category_id, expense.user_id)]
+                bucket[0] += sign * expense.amount
+                bucket[1] += sign
+
+    _upsert(DailyExpenseRollup, "day", daily)
+    _upsert(MonthlyExpenseRollup, "month", monthly)
+
+
+def _upsert(model, period_column: str, buckets: dict) -> None:
+    rows = sorted(
+        ((key, value) for key, value in buckets.items() if value[1] or value[0]),
+        key=lambda row: tuple(str(part) for part in row[0]),
+    )
+    sql = _UPSERT_SQL.format(table=model._meta.db_table, period=period_column, values="{values}")
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            batch = rows[start:start + UPSERT_BATCH_SIZE]
+            params = [param for key, (total, count) in batch for param in (*key, total, count)]
+            cursor.execute(sql.format(values=", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(batch))), params)
+
+
+def detach_rollups(column: str, value) -> None:
+    with connection.cursor() as cursor:
+        for model, period_column in ((DailyExpenseRollup, "day"), (MonthlyExpenseRollup, "month")):
+            values = ", ".join(
+                "NULL" if name == column else name
+                for name in ("family_id", period_column, "category_id", "user_id", "total", "count")
+            )
+            sql = _DETACH_SQL.format(table=model._meta.db_table, column=column, period=period_column, values=values)
+            cursor.execute(sql, [value])
+
+
+def _split_range(date_from: date, date_to: date):
+    first_full_month = date_from if date_from.day == 1 else next_month(date_from)
+    last_full_month = month_start(date_to)
+
+    if first_full_month >= last_full_month:
+        return [(date_from, date_to)], None
+
+    daily_ranges = [
+        (start, end)
+        for start, end in ((date_from, first_full_month), (last_full_month, date_to))
+        if start < end
+    ]
+    return daily_ranges, (first_full_month, last_full_month)
+
+
+def sum_rollups(family_id, date_from: date, date_to: date, group_by: tuple[str, ...] = ()) -> list[dict]:
+    daily_ranges, monthly_range = _split_range(date_from, date_to)
+    querysets = []
+
+    if daily_ranges:
+        condition = Q()
+        for start, end in daily_ranges:
+            condition |= Q(day__gte=start, day__lt=end)
+        querysets.append(DailyExpenseRollup.objects.filter(condition, family_id=family_id))
+
+    if monthly_range:
+        start, end = monthly_range
+        querysets.append(MonthlyExpenseRollup.objects.filter(family_id=family_id, month__gte=start, month__lt=end))
+
+    totals = defaultdict(lambda: [Decimal(0), 0])
+    for queryset in querysets:
+        rows = queryset.order_by().values(*group_by).annotate(sum_total=Sum("total"), sum_count=Sum("count"))
+        for row in rows:
+            bucket = totals[tuple(row[field] for field in group_by)]
+            bucket[0] += row["sum_total"] or 0
+            bucket[1] += row["sum_count"] or 0
+
+    return [
+        {**dict(zip(group_by, key)), "total": total, "count": count}
+        for key, (total, count) in totals.items()
+        if count
+    ]
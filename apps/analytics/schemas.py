@@ -0,0 +1,65 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from ninja import Schema
+
+class SummarySchema(Schema):
+
+    date_from: date
+    date_to: date
+    total: Decimal
+    count: int
+    daily_average: Decimal
+
+class CategoryBreakdownSchema(Schema):
+
+    category_id: Optional[UUID]
+    category_name: Optional[str]
+    total: Decimal
+    count: int
+    share: float
+
+class TrendPointSchema(Schema):
+
+    month: date
+    total: Decimal
+    count: int
+
+class TrendsSchema(Schema):
+
+    points: List[TrendPointSchema]
+
+class DailyPointSchema(Schema):
+
+    date: date
+    total: float
+    ma7: float
+    ma30: float
+
+class MonthlyPointSchema(Schema):
+
+    month: date
+    total: float
+    mom_change: Optional[float]
+
+class CategoryPercentilesSchema(Schema):
+
+    category_id: Optional[UUID]
+    p50: float
+    p90: float
+    count: int
+    total: float
+
+class ForecastSchema(Schema):
+
+    next_month: float
+    current_month_projection: float
+
+class InsightsSchema(Schema):
+
+    daily: List[DailyPointSchema]
+    monthly: List[MonthlyPointSchema]
+    category_percentiles: List[CategoryPercentilesSchema]
+    forecast: ForecastSchema
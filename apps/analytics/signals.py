@@ -0,0 +1,17 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from apps.categories.models import Category
+from apps.users.models import User
+
+from .rollups import detach_rollups
+
+
+@receiver(pre_delete, sender=Category)
+def detach_category_rollups(sender, instance, **kwargs):
+    detach_rollups("category_id", instance.id)
+
+
+@receiver(pre_delete, sender=User)
+def detach_user_rollups(sender, instance, **kwargs):
+    detach_rollups("user_id", instance.id)
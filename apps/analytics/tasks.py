@@ -0,0 +1,34 @@
+import logging
+
+from celery import shared_task
+
+from household_manager.db_router import use_replica
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+@use_replica
+def generate_monthly_reports():
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from .models import MonthlyExpenseRollup
+    from .reports import store_monthly_report
+    from .rollups import month_start
+
+    month = month_start(month_start(timezone.localdate()) - timedelta(days=1))
+    family_ids = (
+        MonthlyExpenseRollup.objects.filter(month=month, count__gt=0)
+        .values_list("family_id", flat=True)
+        .distinct()
+    )
+
+    generated = 0
+    for family_id in family_ids.iterator():
+        store_monthly_report(family_id, month)
+        generated += 1
+
+    logger.info("Generated %s monthly reports for %s", generated, month)
+    return generated
@@ -1 +1,21 @@
 from django.contrib import admin
+
+from .models import Budget, BudgetPeriod
+
+class BudgetPeriodInline(admin.TabularInline):
+
+    model = BudgetPeriod
+    extra = 0
+    readonly_fields = ["start", "end", "spent", "notified_threshold", "updated_at"]
+    can_delete = False
+
+@admin.register(Budget)
+class BudgetAdmin(admin.ModelAdmin):
+
+    list_display = ["name", "family", "category", "amount", "period", "is_active", "starts_on"]
+    list_filter = ["period", "is_active"]
+    search_fields = ["name", "family__name"]
+    raw_id_fields = ["family", "category", "created_by"]
+    list_select_related = ["family", "category"]
+    readonly_fields = ["created_at", "updated_at"]
+    inlines = [BudgetPeriodInline]
@@ -1,7 +1,125 @@
+from uuid import UUID
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from ninja import Router
+from ninja.errors import HttpError
+
+from apps.categories.models import Category
+from apps.families.models import FamilyPermission
+from apps.families.permissions import require_family_permission
+from apps.users.api import auth
+from household_manager.db_router import use_replica
+from household_manager.transactions import atomic_route
+
+from .counters import get_current_spend, refresh_threshold, seed_current_period
+from .models import Budget
+from .schemas import BudgetCreateSchema, BudgetResponseSchema, BudgetUpdateSchema
+
 router = Router()
 
-@router.get("/")
-def list_budgets(request):
 
-    return {"message": "Budgets API - coming soon"}
+def _serialize_budgets(budgets):
+    spend = get_current_spend(budget for budget in budgets if budget.is_active)
+    today = timezone.localdate()
+
+    result = []
+    for budget in budgets:
+        period_start, period_end, spent = spend.get(budget.id, (today, today, 0))
+        result.append(
+            {
+                "id": budget.id,
+                "family_id": budget.family_id,
+                "category_id": budget.category_id,
+                "name": budget.name,
+                "amount": budget.amount,
+                "period": budget.period,
+                "starts_on": budget.starts_on,
+                "is_active": budget.is_active,
+                "period_start": period_start,
+                "period_end": period_end,
+                "spent": spent,
+                "remaining": budget.amount - spent,
+                "percent": round(float(spent * 100 / budget.amount), 2),
+                "created_at": budget.created_at,
+            }
+        )
+    return result
+
+
+@router.get("/family/{family_id}", response=list[BudgetResponseSchema], auth=auth)
+@require_family_permission()
+@use_replica
+def list_budgets(request, family_id: UUID):
+    budgets = list(Budget.objects.filter(family_id=family_id).order_by("-is_active", "name"))
+    return _serialize_budgets(budgets)
+
+
+@router.post("/family/{family_id}", response=BudgetResponseSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.EDIT, "You don't have permission to manage budgets")
+def create_budget(request, family_id: UUID, payload: BudgetCreateSchema):
+    if payload.category_id is not None:
+        category_exists = Category.objects.filter(
+            Q(family_id=family_id) | Q(is_default=True), id=payload.category_id
+        ).exists()
+        if not category_exists:
+            raise HttpError(400, "Unknown category")
+
+    try:
+        with transaction.atomic():
+            budget = Budget.objects.create(
+                family_id=family_id,
+                category_id=payload.category_id,
+                name=payload.name,
+                amount=payload.amount,
+                period=payload.period,
+                starts_on=timezone.localdate(),
+                created_by_id=request.auth.id,
+            )
+            seed_current_period(budget)
+    except IntegrityError:
+        raise HttpError(400, "An active budget for this category and period already exists")
+
+    [result] = _serialize_budgets([budget])
+    return result
+
+
+@router.patch("/family/{family_id}/{budget_id}", response=BudgetResponseSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.EDIT, "You don't have permission to manage budgets")
+def update_budget(request, family_id: UUID, budget_id: UUID, payload: BudgetUpdateSchema):
+    budget = get_object_or_404(Budget, id=budget_id, family_id=family_id)
+
+    changes = payload.model_dump(exclude_unset=True, exclude_none=True)
+    reactivated = changes.get("is_active") and not budget.is_active
+    for attr, value in changes.items():
+        setattr(budget, attr, value)
+    if reactivated:
+        budget.starts_on = timezone.localdate()
+        changes["starts_on"] = budget.starts_on
+
+    try:
+        with transaction.atomic():
+            budget.save(update_fields=[*changes, "updated_at"])
+            if reactivated:
+                seed_current_period(budget)
+            elif "amount" in changes:
+                refresh_threshold(budget)
+    except IntegrityError:
+        raise HttpError(400, "An active budget for this category and period already exists")
+
+    [result] = _serialize_budgets([budget])
+    return result
+
+
+@router.delete("/family/{family_id}/{budget_id}", auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.EDIT, "You don't have permission to manage budgets")
+def delete_budget(request, family_id: UUID, budget_id: UUID):
+    budget = get_object_or_404(Budget, id=budget_id, family_id=family_id)
+    budget.delete()
+
+    return {"detail": "Budget deleted successfully"}
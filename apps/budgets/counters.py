@@ -0,0 +1,196 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.analytics.rollups import month_start, next_month, sum_rollups
+from apps.notifications.events import publish_family_event
+from apps.notifications.tasks import send_budget_threshold_alert
+
+from .models import Budget, BudgetPeriod, BudgetPeriodType
+
+THRESHOLDS = (50, 80, 100)
+CENT = Decimal("0.01")
+SPEND_KEY = "budget:{budget_id}:{start}:spent_cents"
+
+_UPSERT_SQL = """
+    INSERT INTO budget_periods (budget_id, start, "end", spent, notified_threshold, updated_at)
+    VALUES {values}
+    ON CONFLICT (budget_id, start) DO UPDATE
+    SET spent = budget_periods.spent + EXCLUDED.spent,
+        updated_at = EXCLUDED.updated_at
+    RETURNING id, budget_id, start, spent, notified_threshold
+"""
+
+
+def period_bounds(period: str, day: date) -> tuple[date, date]:
+    if period == BudgetPeriodType.WEEKLY:
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    if period == BudgetPeriodType.YEARLY:
+        return date(day.year, 1, 1), date(day.year + 1, 1, 1)
+    return month_start(day), next_month(day)
+
+
+def threshold_reached(spent: Decimal, amount: Decimal) -> int:
+    ratio = spent * 100 / amount if amount else 0
+    return max((threshold for threshold in THRESHOLDS if ratio >= threshold), default=0)
+
+
+def _spend_key(budget_id, start: date) -> str:
+    return SPEND_KEY.format(budget_id=budget_id, start=start.isoformat())
+
+
+def _cents(value: Decimal) -> int:
+    return int(value * 100)
+
+
+def _period_deltas(budgets: list[Budget], added: Iterable, removed: Iterable) -> dict:
+    spend = defaultdict(Decimal)
+    for expenses, sign in ((added, 1), (removed, -1)):
+        for expense in expenses:
+            spend[(expense.family_id, expense.category_id, timezone.localdate(expense.spent_at))] += sign * expense.amount
+
+    budgets_by_family = defaultdict(list)
+    for budget in budgets:
+        budgets_by_family[budget.family_id].append(budget)
+
+    deltas = defaultdict(Decimal)
+    for (family_id, category_id, day), amount in spend.items():
+        for budget in budgets_by_family[family_id]:
+            if budget.category_id is not None and budget.category_id != category_id:
+                continue
+            start, end = period_bounds(budget.period, day)
+            if start < period_bounds(budget.period, budget.starts_on)[0]:
+                continue
+            deltas[(budget, start, end)] += amount
+
+    return {key: amount for key, amount in deltas.items() if amount}
+
+
+def apply_budget_spend(added: Iterable = (), removed: Iterable = ()) -> None:
+    added, removed = list(added), list(removed)
+    family_ids = {expense.family_id for expense in added + removed}
+    if not family_ids:
+        return
+
+    budgets = list(Budget.objects.filter(family_id__in=family_ids, is_active=True))
+    deltas = _period_deltas(budgets, added, removed)
+    if not deltas:
+        return
+
+    rows = sorted(deltas.items(), key=lambda row: (str(row[0][0].id), row[0][1]))
+    budgets_by_id = {budget.id: budget for (budget, _, _), _ in rows}
+    now = timezone.now()
+    params = [
+        param
+        for (budget, start, end), amount in rows
+        for param in (budget.id, start, end, amount, 0, now)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(_UPSERT_SQL.format(values=", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(rows))), params)
+        periods = cursor.fetchall()
+
+    crossings = []
+    for period_id, budget_id, start, spent, notified in periods:
+        budget = budgets_by_id[budget_id]
+        reached = threshold_reached(spent, budget.amount)
+        if reached != notified:
+            BudgetPeriod.objects.filter(id=period_id).update(notified_threshold=reached)
+        if reached > notified:
+            crossings.append((budget, start, spent, reached))
+
+    increments = {_spend_key(budget.id, start): _cents(amount) for (budget, start, _), amount in rows}
+    transaction.on_commit(lambda: _increment_counters(increments), robust=True)
+
+    for budget, start, spent, reached in crossings:
+        publish_family_event(
+            budget.family_id,
+            "budget.threshold",
+            {
+                "budget_id": budget.id,
+                "name": budget.name,
+                "period_start": start,
+                "threshold": reached,
+                "spent": spent,
+                "amount": budget.amount,
+            },
+        )
+        transaction.on_commit(
+            lambda budget_id=str(budget.id), reached=reached, spent=str(spent): send_budget_threshold_alert.delay(
+                budget_id, reached, spent
+            ),
+            robust=True,
+        )
+
+
+def _increment_counters(increments: dict) -> None:
+    for key, delta in increments.items():
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            pass
+
+
+def get_current_spend(budgets: Iterable[Budget], day: date = None) -> dict:
+    day = day or timezone.localdate()
+    bounds = {budget.id: period_bounds(budget.period, day) for budget in budgets}
+    keys = {_spend_key(budget_id, start): budget_id for budget_id, (start, _) in bounds.items()}
+
+    cached = cache.get_many(keys)
+    spent = {keys[key]: (Decimal(cents) / 100).quantize(CENT) for key, cents in cached.items()}
+
+    missing = [budget_id for key, budget_id in keys.items() if key not in cached]
+    if missing:
+        condition = Q()
+        for budget_id in missing:
+            condition |= Q(budget_id=budget_id, start=bounds[budget_id][0])
+        stored = dict(
+            BudgetPeriod.objects.using(DEFAULT_DB_ALIAS).filter(condition).values_list("budget_id", "spent")
+        )
+
+        for budget_id in missing:
+            value = stored.get(budget_id, Decimal(0))
+            spent[budget_id] = value
+            cache.add(
+                _spend_key(budget_id, bounds[budget_id][0]), _cents(value), settings.BUDGET_COUNTER_FILL_TIMEOUT
+            )
+
+    return {budget_id: (start, end, spent[budget_id]) for budget_id, (start, end) in bounds.items()}
+
+
+def seed_current_period(budget: Budget) -> BudgetPeriod:
+    start, end = period_bounds(budget.period, budget.starts_on)
+    rows = sum_rollups(budget.family_id, start, end, group_by=("category_id",))
+    spent = sum(
+        (row["total"] for row in rows if budget.category_id is None or row["category_id"] == budget.category_id),
+        Decimal(0),
+    )
+
+    period, _ = BudgetPeriod.objects.update_or_create(
+        budget=budget,
+        start=start,
+        defaults={
+            "end": end,
+            "spent": spent,
+            "notified_threshold": threshold_reached(spent, budget.amount),
+        },
+    )
+    key = _spend_key(budget.id, start)
+    transaction.on_commit(lambda: cache.set(key, _cents(spent), settings.BUDGET_COUNTER_TIMEOUT), robust=True)
+    return period
+
+
+def refresh_threshold(budget: Budget) -> None:
+    start, _ = period_bounds(budget.period, timezone.localdate())
+    period = BudgetPeriod.objects.filter(budget=budget, start=start).first()
+    if period is not None:
+        reached = threshold_reached(period.spent, budget.amount)
+        if reached != period.notified_threshold:
+            BudgetPeriod.objects.filter(id=period.id).update(notified_threshold=reached)
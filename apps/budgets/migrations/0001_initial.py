@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:46
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('categories', '0002_initial'),
+        ('families', '0003_family_active_members_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Budget',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='budget name')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='limit')),
+                ('period', models.CharField(choices=[('weekly', 'Weekly'), ('monthly', 'Monthly'), ('yearly', 'Yearly')], default='monthly', max_length=10, verbose_name='period')),
+                ('starts_on', models.DateField(verbose_name='tracked since')),
+                ('is_active', models.BooleanField(default=True, verbose_name='is active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='budgets', to='categories.category', verbose_name='category')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_budgets', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='budgets', to='families.family', verbose_name='family')),
+            ],
+            options={
+                'verbose_name': 'budget',
+                'verbose_name_plural': 'budgets',
+                'db_table': 'budgets',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BudgetPeriod',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.DateField(verbose_name='period start')),
+                ('end', models.DateField(verbose_name='period end')),
+                ('spent', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='spent')),
+                ('notified_threshold', models.PositiveSmallIntegerField(default=0, verbose_name='last threshold reached, %')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('budget', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='periods', to='budgets.budget', verbose_name='budget')),
+            ],
+            options={
+                'verbose_name': 'budget period',
+                'verbose_name_plural': 'budget periods',
+                'db_table': 'budget_periods',
+                'ordering': ['-start'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['family', 'is_active'], name='idx_budget_family_active'),
+        ),
+        migrations.AddConstraint(
+            model_name='budget',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('family', 'category', 'period'), name='uniq_active_budget', nulls_distinct=False),
+        ),
+        migrations.AddConstraint(
+            model_name='budgetperiod',
+            constraint=models.UniqueConstraint(fields=('budget', 'start'), name='uniq_budget_period'),
+        ),
+    ]
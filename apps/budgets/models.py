@@ -1 +1,98 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.categories.models import Category
+from apps.families.models import Family
+
+class BudgetPeriodType(models.TextChoices):
+
+    WEEKLY = "weekly", _("Weekly")
+    MONTHLY = "monthly", _("Monthly")
+    YEARLY = "yearly", _("Yearly")
+
+class Budget(models.Model):
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="budgets",
+        verbose_name=_("family"),
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="budgets",
+        verbose_name=_("category"),
+    )
+    name = models.CharField(_("budget name"), max_length=100)
+    amount = models.DecimalField(_("limit"), max_digits=12, decimal_places=2)
+    period = models.CharField(
+        _("period"),
+        max_length=10,
+        choices=BudgetPeriodType.choices,
+        default=BudgetPeriodType.MONTHLY,
+    )
+    starts_on = models.DateField(_("tracked since"))
+    is_active = models.BooleanField(_("is active"), default=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="created_budgets",
+        verbose_name=_("created by"),
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "budgets"
+        verbose_name = _("budget")
+        verbose_name_plural = _("budgets")
+        ordering = ["name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["family", "category", "period"],
+                condition=models.Q(is_active=True),
+                name="uniq_active_budget",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["family", "is_active"], name="idx_budget_family_active"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.amount} / {self.period})"
+
+class BudgetPeriod(models.Model):
+
+    budget = models.ForeignKey(
+        Budget,
+        on_delete=models.CASCADE,
+        related_name="periods",
+        verbose_name=_("budget"),
+    )
+    start = models.DateField(_("period start"))
+    end = models.DateField(_("period end"))
+    spent = models.DecimalField(_("spent"), max_digits=14, decimal_places=2, default=0)
+    notified_threshold = models.PositiveSmallIntegerField(_("last threshold reached, %"), default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "budget_periods"
+        verbose_name = _("budget period")
+        verbose_name_plural = _("budget periods")
+        ordering = ["-start"]
+        constraints = [
+            models.UniqueConstraint(fields=["budget", "start"], name="uniq_budget_period"),
+        ]
+
+    def __str__(self):
+        return f"{self.budget} {self.start:%Y-%m-%d}: {self.spent}"
@@ -0,0 +1,37 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import Field
+
+class BudgetCreateSchema(Schema):
+
+    name: str = Field(..., min_length=1, max_length=100)
+    amount: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
+    period: str = Field("monthly", pattern="^(weekly|monthly|yearly)$")
+    category_id: Optional[UUID] = None
+
+class BudgetUpdateSchema(Schema):
+
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    amount: Optional[Decimal] = Field(None, gt=0, max_digits=12, decimal_places=2)
+    is_active: Optional[bool] = None
+
+class BudgetResponseSchema(Schema):
+
+    id: UUID
+    family_id: UUID
+    category_id: Optional[UUID]
+    name: str
+    amount: Decimal
+    period: str
+    starts_on: date
+    is_active: bool
+    period_start: date
+    period_end: date
+    spent: Decimal
+    remaining: Decimal
+    percent: float
+    created_at: datetime
@@ -1,6 +1,9 @@
 from django.contrib import admin
 
+from apps.families.versions import bump_data_version
+
 from .models import Category
+from .versions import bump_defaults_version
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -15,3 +18,22 @@ class CategoryAdmin(admin.ModelAdmin):
         ("Appearance", {"fields": ("color", "icon")}),
         ("Metadata", {"fields": ("created_by", "created_at", "updated_at")}),
     )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._bump_versions(obj)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self._bump_versions(obj)
+
+    def delete_queryset(self, request, queryset):
+        categories = list(queryset)
+        super().delete_queryset(request, queryset)
+        for category in categories:
+            self._bump_versions(category)
+
+    def _bump_versions(self, category):
+        bump_defaults_version()
+        if category.family_id:
+            bump_data_version(category.family_id)
@@ -1,50 +1,90 @@
+import logging
 from uuid import UUID
 
-from django.shortcuts import get_object_or_404
-from ninja import Router
-from ninja.errors import HttpError
+from ninja import Query, Router
 
-from apps.families.models import Family, FamilyMember
-from apps.users.api import auth
+from apps.expenses.models import CategorySource
+from apps.families.models import Family, FamilyPermission
+from apps.families.permissions import require_family_permission
+from apps.families.versions import bump_data_version, family_response_version
+from apps.ml_categorizer.categorize import type_categories
+from apps.ml_categorizer.merchants import lookup_categories, normalize_merchant
+from apps.ml_categorizer.service import expense_text, predict
+from apps.users.api import async_auth, auth
+from household_manager.response_cache import cache_response
+from household_manager.transactions import atomic_route
 
 from .models import Category
-from .schemas import CategoryCreateSchema, CategoryResponseSchema, CategoryUpdateSchema
-
-router = Router()
+from .schemas import CategoryCreateSchema, CategoryResponseSchema, CategorySuggestionSchema, CategoryUpdateSchema
+from .versions import defaults_response_version
 
+logger = logging.getLogger(__name__)
 
-@router.get("/family/{family_id}", response=list[CategoryResponseSchema], auth=auth)
-def list_categories(request, family_id: UUID):
-    user = request.auth
+router = Router()
 
-    get_object_or_404(FamilyMember, family_id=family_id, user=user, is_active=True)
 
+@router.get("/family/{family_id}", response=list[CategoryResponseSchema], auth=async_auth)
+@require_family_permission()
+@cache_response(family_response_version)
+async def list_categories(request, family_id: UUID):
     categories = Category.objects.filter(family_id=family_id).order_by("type", "name")
-    return list(categories)
+    return [category async for category in categories]
 
 
 @router.post("/family/{family_id}", response=CategoryResponseSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.ADD, "You don't have permission to add categories")
 def create_category(request, family_id: UUID, payload: CategoryCreateSchema):
     user = request.auth
 
-    member = get_object_or_404(FamilyMember, family_id=family_id, user=user, is_active=True)
-
-    if not member.has_permission("add"):
-        raise HttpError(403, "You don't have permission to add categories")
-
     category = Category.objects.create(
         name=payload.name,
         type=payload.type,
         color=payload.color,
         icon=payload.icon or "",
         family_id=family_id,
-        created_by=user,
+        created_by_id=user.id,
     )
+    bump_data_version(family_id)
 
     return category
 
 
-@router.get("/defaults", response=list[CategoryResponseSchema], auth=auth)
-def list_default_categories(request):
+@router.get("/family/{family_id}/suggest", response={200: CategorySuggestionSchema, 204: None}, auth=auth)
+@require_family_permission()
+def suggest_category(
+    request,
+    family_id: UUID,
+    merchant: str = Query("", max_length=150),
+    description: str = Query("", max_length=255),
+):
+    known = lookup_categories(family_id, [merchant]).get(normalize_merchant(merchant))
+    if known is not None:
+        return {"category_id": known, "category_type": None, "confidence": 1.0, "source": CategorySource.MERCHANT}
+
+    text = expense_text(merchant, description)
+    try:
+        prediction = predict(text) if text else None
+    except TimeoutError:
+        logger.warning("Category prediction timed out for family %s", family_id)
+        prediction = None
+    if prediction is None:
+        return 204, None
+
+    category_id = type_categories(family_id).get(prediction.category_type)
+    if category_id is None:
+        return 204, None
+
+    return {
+        "category_id": category_id,
+        "category_type": prediction.category_type,
+        "confidence": prediction.confidence,
+        "source": CategorySource.MODEL,
+    }
+
+
+@router.get("/defaults", response=list[CategoryResponseSchema], auth=async_auth)
+@cache_response(defaults_response_version)
+async def list_default_categories(request):
     categories = Category.objects.filter(is_default=True).order_by("type", "name")
-    return list(categories)
+    return [category async for category in categories]
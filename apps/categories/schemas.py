@@ -28,3 +28,10 @@ class CategoryResponseSchema(Schema):
     is_default: bool
     created_at: datetime
     updated_at: datetime
+
+class CategorySuggestionSchema(Schema):
+
+    category_id: UUID
+    category_type: Optional[str]
+    confidence: float
+    source: str
@@ -0,0 +1,17 @@
+from django.db import transaction
+
+from household_manager.cache import bump_version, get_version
+
+DEFAULTS_VERSION_KEY = "categories:defaults:data_version"
+
+
+def get_defaults_version() -> int:
+    return get_version(DEFAULTS_VERSION_KEY)
+
+
+def bump_defaults_version() -> None:
+    transaction.on_commit(lambda: bump_version(DEFAULTS_VERSION_KEY))
+
+
+def defaults_response_version(request, **kwargs) -> str:
+    return f"categories:defaults:{get_defaults_version()}"
@@ -1 +1,25 @@
 from django.contrib import admin
+
+from .models import Expense
+
+@admin.register(Expense)
+class ExpenseAdmin(admin.ModelAdmin):
+
+    list_display = ["spent_at", "amount", "currency", "family", "category", "user", "source"]
+    list_filter = ["source", "currency", "spent_at"]
+    search_fields = ["merchant", "description", "family__name", "user__email"]
+    list_select_related = ["family", "category", "user"]
+    readonly_fields = ["family", "user", "category", "amount", "spent_at", "created_at", "updated_at"]
+    date_hierarchy = "spent_at"
+
+    fieldsets = (
+        (None, {"fields": ("family", "user", "category", "amount", "currency", "spent_at")}),
+        ("Details", {"fields": ("merchant", "description", "source")}),
+        ("Timestamps", {"fields": ("created_at", "updated_at")}),
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
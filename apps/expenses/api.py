@@ -1,7 +1,185 @@
-from ninja import Router
+import base64
+import binascii
+import json
+from datetime import datetime
+from itertools import islice
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from apps.categories.models import Category
+from apps.families.models import FamilyPermission
+from apps.families.permissions import require_family_permission
+from apps.users.api import auth
+from household_manager.db_router import read_alias, use_replica
+from household_manager.transactions import atomic_route
+
+from .models import Expense, ExpenseSource
+from .schemas import (
+    ExpenseBulkCreateSchema,
+    ExpenseBulkResultSchema,
+    ExpenseCreateSchema,
+    ExpenseFilterSchema,
+    ExpensePageSchema,
+    ExpenseResponseSchema,
+    ExpenseUpdateSchema,
+)
+from .services import create_expenses, delete_expense, update_expense
+
 router = Router()
 
-@router.get("/")
-def list_expenses(request):
 
-    return {"message": "Expenses API - coming soon"}
+def _validate_categories(family_id, category_ids):
+    requested = {category_id for category_id in category_ids if category_id is not None}
+    if not requested:
+        return
+
+    known = set(
+        Category.objects.filter(Q(family_id=family_id) | Q(is_default=True), id__in=requested)
+        .values_list("id", flat=True)
+    )
+    unknown = requested - known
+    if unknown:
+        raise HttpError(400, f"Unknown categories: {', '.join(sorted(map(str, unknown)))}")
+
+
+EXPORT_FIELDS = (
+    "id",
+    "family_id",
+    "user_id",
+    "category_id",
+    "category_source",
+    "amount",
+    "currency",
+    "source",
+    "merchant",
+    "description",
+    "spent_at",
+    "created_at",
+    "updated_at",
+)
+
+
+def _encode_cursor(expense) -> str:
+    raw = f"{expense.spent_at.isoformat()}|{expense.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        spent_at, expense_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(spent_at), int(expense_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HttpError(400, "Invalid cursor")
+
+
+def _filter_expenses(family_id, filters: ExpenseFilterSchema):
+    expenses = Expense.objects.filter(family_id=family_id)
+
+    if filters.category_id is not None:
+        expenses = expenses.filter(category_id=filters.category_id)
+    if filters.user_id is not None:
+        expenses = expenses.filter(user_id=filters.user_id)
+    if filters.date_from is not None:
+        expenses = expenses.filter(spent_at__gte=filters.date_from)
+    if filters.date_to is not None:
+        expenses = expenses.filter(spent_at__lt=filters.date_to)
+    if filters.min_amount is not None:
+        expenses = expenses.filter(amount__gte=filters.min_amount)
+    if filters.max_amount is not None:
+        expenses = expenses.filter(amount__lte=filters.max_amount)
+
+    if filters.cursor:
+        spent_at, expense_id = _decode_cursor(filters.cursor)
+        expenses = expenses.filter(spent_at__lte=spent_at).filter(
+            Q(spent_at__lt=spent_at) | Q(id__lt=expense_id)
+        )
+
+    return expenses.order_by("-spent_at", "-id")
+
+
+async def _stream_ndjson(expenses):
+    lines = (
+        json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+        for row in expenses.values(*EXPORT_FIELDS).iterator(chunk_size=settings.EXPENSES_EXPORT_CHUNK_SIZE)
+    )
+    next_chunk = sync_to_async(lambda: "".join(islice(lines, settings.EXPENSES_EXPORT_CHUNK_SIZE)))
+
+    while chunk := await next_chunk():
+        yield chunk
+
+
+@router.get("/family/{family_id}", response=ExpensePageSchema, auth=auth)
+@require_family_permission()
+@use_replica
+def list_expenses(request, family_id: UUID, filters: Query[ExpenseFilterSchema]):
+    expenses = _filter_expenses(family_id, filters)
+
+    if filters.format == "ndjson":
+        return StreamingHttpResponse(
+            _stream_ndjson(expenses.using(read_alias())), content_type="application/x-ndjson"
+        )
+
+    page = list(expenses[: filters.limit + 1])
+    next_cursor = _encode_cursor(page[filters.limit - 1]) if len(page) > filters.limit else None
+
+    return {"items": page[: filters.limit], "next_cursor": next_cursor}
+
+
+@router.post("/family/{family_id}", response=ExpenseResponseSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.ADD, "You don't have permission to add expenses")
+def create_expense(request, family_id: UUID, payload: ExpenseCreateSchema):
+    _validate_categories(family_id, [payload.category_id])
+
+    [expense] = create_expenses(family_id, request.auth.id, [payload.model_dump()], ExpenseSource.MANUAL)
+    return expense
+
+
+@router.post("/family/{family_id}/bulk", response=ExpenseBulkResultSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.ADD, "You don't have permission to add expenses")
+def bulk_create_expenses(request, family_id: UUID, payload: ExpenseBulkCreateSchema):
+    items = [item.model_dump() for item in payload.items]
+    _validate_categories(family_id, [item["category_id"] for item in items])
+
+    expenses = create_expenses(family_id, request.auth.id, items, payload.source)
+    return {"created": len(expenses)}
+
+
+@router.patch("/family/{family_id}/{expense_id}", response=ExpenseResponseSchema, auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.EDIT, "You don't have permission to edit expenses")
+def update_family_expense(request, family_id: UUID, expense_id: int, payload: ExpenseUpdateSchema):
+    expense = get_object_or_404(
+        Expense.objects.select_for_update(), id=expense_id, family_id=family_id
+    )
+
+    changes = {
+        attr: value
+        for attr, value in payload.model_dump(exclude_unset=True).items()
+        if value is not None or attr == "category_id"
+    }
+    if "category_id" in changes:
+        _validate_categories(family_id, [changes["category_id"]])
+
+    return update_expense(expense, changes)
+
+
+@router.delete("/family/{family_id}/{expense_id}", auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.DELETE, "You don't have permission to delete expenses")
+def delete_family_expense(request, family_id: UUID, expense_id: int):
+    expense = get_object_or_404(
+        Expense.objects.select_for_update(), id=expense_id, family_id=family_id
+    )
+    delete_expense(expense)
+
+    return {"detail": "Expense deleted successfully"}
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:26
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('categories', '0002_initial'),
+        ('families', '0003_family_active_members_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Expense',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('spent_at', models.DateTimeField(verbose_name='spent at')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='amount')),
+                ('currency', models.CharField(default='RUB', max_length=3, verbose_name='currency')),
+                ('source', models.CharField(choices=[('manual', 'Manual'), ('import', 'Import'), ('receipt', 'Receipt'), ('telegram', 'Telegram')], default='manual', max_length=10, verbose_name='source')),
+                ('merchant', models.CharField(blank=True, max_length=150, verbose_name='merchant')),
+                ('description', models.CharField(blank=True, max_length=255, verbose_name='description')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='expenses', to='categories.category', verbose_name='category')),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='expenses', to='families.family', verbose_name='family')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='expenses', to=settings.AUTH_USER_MODEL, verbose_name='spent by')),
+            ],
+            options={
+                'verbose_name': 'expense',
+                'verbose_name_plural': 'expenses',
+                'db_table': 'expenses',
+                'ordering': ['-spent_at', '-id'],
+                'indexes': [models.Index(fields=['family', 'spent_at'], name='idx_expense_family_spent'), models.Index(fields=['family', 'category', 'spent_at'], name='idx_expense_family_cat'), django.contrib.postgres.indexes.BrinIndex(autosummarize=True, fields=['spent_at'], name='brin_expense_spent')],
+            },
+        ),
+    ]
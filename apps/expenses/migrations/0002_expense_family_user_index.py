@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_initial'),
+        ('expenses', '0001_initial'),
+        ('families', '0003_family_active_members_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['family', 'user', 'spent_at'], name='idx_expense_family_user'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0002_expense_family_user_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expense',
+            name='category_source',
+            field=models.CharField(blank=True, choices=[('manual', 'Manual'), ('model', 'ML model')], max_length=10, verbose_name='category source'),
+        ),
+    ]
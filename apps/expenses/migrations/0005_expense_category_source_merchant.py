@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_expense_labeled_updated_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='expense',
+            name='category_source',
+            field=models.CharField(blank=True, choices=[('manual', 'Manual'), ('model', 'ML model'), ('merchant', 'Merchant history')], max_length=10, verbose_name='category source'),
+        ),
+    ]
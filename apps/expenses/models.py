@@ -1 +1,84 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.categories.models import Category
+from apps.families.models import Family
+
+class ExpenseSource(models.TextChoices):
+
+    MANUAL = "manual", _("Manual")
+    IMPORT = "import", _("Import")
+    RECEIPT = "receipt", _("Receipt")
+    TELEGRAM = "telegram", _("Telegram")
+
+class CategorySource(models.TextChoices):
+
+    MANUAL = "manual", _("Manual")
+    MODEL = "model", _("ML model")
+    MERCHANT = "merchant", _("Merchant history")
+
+class Expense(models.Model):
+
+    id = models.BigAutoField(primary_key=True)
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="expenses",
+        verbose_name=_("family"),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="expenses",
+        verbose_name=_("spent by"),
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="expenses",
+        verbose_name=_("category"),
+    )
+    category_source = models.CharField(
+        _("category source"),
+        max_length=10,
+        choices=CategorySource.choices,
+        blank=True,
+    )
+    spent_at = models.DateTimeField(_("spent at"))
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    amount = models.DecimalField(_("amount"), max_digits=12, decimal_places=2)
+    currency = models.CharField(_("currency"), max_length=3, default="RUB")
+    source = models.CharField(
+        _("source"),
+        max_length=10,
+        choices=ExpenseSource.choices,
+        default=ExpenseSource.MANUAL,
+    )
+    merchant = models.CharField(_("merchant"), max_length=150, blank=True)
+    description = models.CharField(_("description"), max_length=255, blank=True)
+
+    class Meta:
+        db_table = "expenses"
+        verbose_name = _("expense")
+        verbose_name_plural = _("expenses")
+        ordering = ["-spent_at", "-id"]
+        indexes = [
+            models.Index(fields=["family", "spent_at"], name="idx_expense_family_spent"),
+            models.Index(fields=["family", "category", "spent_at"], name="idx_expense_family_cat"),
+            models.Index(fields=["family", "user", "spent_at"], name="idx_expense_family_user"),
+            BrinIndex(fields=["spent_at"], name="brin_expense_spent", autosummarize=True),
+            models.Index(
+                fields=["updated_at"],
+                name="idx_expense_labeled_updated",
+                condition=models.Q(category_source="manual", category__isnull=False),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.amount} {self.currency} ({self.spent_at:%Y-%m-%d})"
@@ -0,0 +1,68 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from django.conf import settings
+from ninja import Schema
+from pydantic import Field
+
+class ExpenseCreateSchema(Schema):
+
+    amount: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
+    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+    category_id: Optional[UUID] = None
+    spent_at: datetime
+    merchant: str = Field("", max_length=150)
+    description: str = Field("", max_length=255)
+
+class ExpenseUpdateSchema(Schema):
+
+    amount: Optional[Decimal] = Field(None, gt=0, max_digits=12, decimal_places=2)
+    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+    category_id: Optional[UUID] = None
+    spent_at: Optional[datetime] = None
+    merchant: Optional[str] = Field(None, max_length=150)
+    description: Optional[str] = Field(None, max_length=255)
+
+class ExpenseBulkCreateSchema(Schema):
+
+    source: str = Field(default="import", pattern="^(manual|import|receipt|telegram)$")
+    items: List[ExpenseCreateSchema] = Field(..., min_length=1, max_length=settings.EXPENSES_BULK_MAX_ITEMS)
+
+class ExpenseBulkResultSchema(Schema):
+
+    created: int
+
+class ExpenseResponseSchema(Schema):
+
+    id: int
+    family_id: UUID
+    user_id: Optional[UUID]
+    category_id: Optional[UUID]
+    category_source: str
+    amount: Decimal
+    currency: str
+    source: str
+    merchant: str
+    description: str
+    spent_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+class ExpenseFilterSchema(Schema):
+
+    category_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    min_amount: Optional[Decimal] = Field(None, ge=0)
+    max_amount: Optional[Decimal] = Field(None, ge=0)
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    cursor: Optional[str] = None
+    limit: int = Field(50, ge=1, le=500)
+    format: str = Field("json", pattern="^(json|ndjson)$")
+
+class ExpensePageSchema(Schema):
+
+    items: List[ExpenseResponseSchema]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,145 @@
+from copy import copy
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.analytics.rollups import apply_expenses
+from apps.budgets.counters import apply_budget_spend
+from apps.families.models import Family
+from apps.families.versions import bump_data_version
+from apps.ml_categorizer.merchants import remember_categories
+from apps.ml_categorizer.tasks import categorize_expenses
+from apps.notifications.events import publish_family_event
+
+from .models import CategorySource, Expense
+
+ROLLUP_FIELDS = {"amount", "spent_at", "category_id", "user_id"}
+EVENT_IDS_LIMIT = 50
+
+
+def _aware(value):
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def create_expenses(family_id, user_id, items: list[dict], source: str) -> list[Expense]:
+    family_currency = Family.objects.values_list("currency", flat=True).get(id=family_id)
+
+    expenses = [
+        Expense(
+            family_id=family_id,
+            user_id=user_id,
+            source=source,
+            category_id=item.get("category_id"),
+            category_source=CategorySource.MANUAL if item.get("category_id") else "",
+            amount=item["amount"],
+            currency=item.get("currency") or family_currency,
+            spent_at=_aware(item["spent_at"]),
+            merchant=item.get("merchant", ""),
+            description=item.get("description", ""),
+        )
+        for item in items
+    ]
+
+    with transaction.atomic(savepoint=False):
+        Expense.objects.bulk_create(expenses, batch_size=settings.EXPENSES_BULK_BATCH_SIZE)
+        apply_expenses(added=expenses)
+        apply_budget_spend(added=expenses)
+        bump_data_version(family_id)
+        remember_categories(family_id, [(expense.merchant, expense.category_id) for expense in expenses])
+        publish_family_event(
+            family_id,
+            "expenses.created",
+            {
+                "user_id": user_id,
+                "count": len(expenses),
+                "total": sum(expense.amount for expense in expenses),
+                "ids": [expense.id for expense in expenses[:EVENT_IDS_LIMIT]],
+            },
+        )
+
+    uncategorized = [
+        expense.id
+        for expense in expenses
+        if expense.category_id is None and (expense.merchant or expense.description)
+    ]
+    chunk_size = settings.ML_CATEGORIZE_CHUNK_SIZE
+    for start in range(0, len(uncategorized), chunk_size):
+        chunk = uncategorized[start:start + chunk_size]
+        transaction.on_commit(lambda chunk=chunk: categorize_expenses.delay(chunk), robust=True)
+
+    return expenses
+
+
+def update_expense(expense: Expense, changes: dict) -> Expense:
+    previous = copy(expense)
+
+    if changes.get("spent_at") is not None:
+        changes["spent_at"] = _aware(changes["spent_at"])
+    if "category_id" in changes:
+        changes["category_source"] = CategorySource.MANUAL if changes["category_id"] else ""
+    for attr, value in changes.items():
+        setattr(expense, attr, value)
+
+    with transaction.atomic(savepoint=False):
+        expense.save(update_fields=[*changes, "updated_at"])
+        if ROLLUP_FIELDS & changes.keys():
+            apply_expenses(added=[expense], removed=[previous])
+            apply_budget_spend(added=[expense], removed=[previous])
+        if changes.get("category_source") == CategorySource.MANUAL:
+            remember_categories(expense.family_id, [(expense.merchant, expense.category_id)])
+        bump_data_version(expense.family_id)
+        publish_family_event(expense.family_id, "expense.updated", {"id": expense.id, "fields": list(changes)})
+
+    return expense
+
+
+def delete_expense(expense: Expense) -> bool:
+    expense_id = expense.id
+
+    with transaction.atomic(savepoint=False):
+        deleted, _ = expense.delete()
+        if not deleted:
+            return False
+        apply_expenses(removed=[expense])
+        apply_budget_spend(removed=[expense])
+        bump_data_version(expense.family_id)
+        publish_family_event(expense.family_id, "expense.deleted", {"id": expense_id})
+    return True
+
+
+def assign_categories(assignments: dict, source: str) -> int:
+    if not assignments:
+        return 0
+
+    with transaction.atomic(savepoint=False):
+        expenses = list(
+            Expense.objects.select_for_update()
+            .filter(id__in=assignments, category__isnull=True)
+            .order_by("id")
+        )
+        previous = [copy(expense) for expense in expenses]
+
+        now = timezone.now()
+        for expense in expenses:
+            expense.category_id = assignments[expense.id]
+            expense.category_source = source
+            expense.updated_at = now
+
+        Expense.objects.bulk_update(
+            expenses,
+            ["category", "category_source", "updated_at"],
+            batch_size=settings.EXPENSES_BULK_BATCH_SIZE,
+        )
+        apply_expenses(added=expenses, removed=previous)
+        apply_budget_spend(added=expenses, removed=previous)
+
+        for family_id in {expense.family_id for expense in expenses}:
+            bump_data_version(family_id)
+            publish_family_event(
+                family_id,
+                "expenses.categorized",
+                {"count": sum(1 for expense in expenses if expense.family_id == family_id), "source": source},
+            )
+
+    return len(expenses)
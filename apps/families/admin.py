@@ -12,14 +12,14 @@ class FamilyMemberInline(admin.TabularInline):
 @admin.register(Family)
 class FamilyAdmin(admin.ModelAdmin):
 
-    list_display = ["name", "owner", "invite_code", "currency", "created_at"]
+    list_display = ["name", "owner", "invite_code", "currency", "active_members_count", "created_at"]
     list_filter = ["currency", "created_at"]
     search_fields = ["name", "owner__email", "invite_code"]
-    readonly_fields = ["invite_code", "created_at", "updated_at"]
+    readonly_fields = ["invite_code", "active_members_count", "created_at", "updated_at"]
     inlines = [FamilyMemberInline]
 
     fieldsets = (
-        (None, {"fields": ("name", "description", "owner", "currency")}),
+        (None, {"fields": ("name", "description", "owner", "currency", "active_members_count")}),
         ("Invitation", {"fields": ("invite_code", "invite_code_expires_at")}),
         ("Timestamps", {"fields": ("created_at", "updated_at")}),
     )
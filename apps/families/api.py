@@ -1,22 +1,33 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import F, Prefetch, Q
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from django.utils import timezone
+from ninja import Query, Router
 from ninja.errors import HttpError
 
-from apps.users.api import auth
+from apps.notifications.events import publish_family_event
+from apps.users.api import async_auth, auth
+from household_manager.db_router import use_replica
+from household_manager.response_cache import cache_response
+from household_manager.transactions import atomic_route
 
-from .models import Family, FamilyMember, FamilyRole
+from .models import Family, FamilyMember, FamilyPermission, FamilyRole
+from .permissions import bump_acl_version, require_family_permission
 from .schemas import (
     FamilyCreateSchema,
     FamilyDetailSchema,
-    FamilyResponseSchema,
+    FamilyPageSchema,
     FamilyUpdateSchema,
     JoinFamilySchema,
     UpdateMemberRoleSchema,
 )
+from .versions import bump_data_version, family_response_version
 
 router = Router()
 
@@ -31,7 +42,7 @@ def _serialize_family(family, include_members: bool = True):
         "invite_code": family.invite_code,
         "invite_code_expires_at": family.invite_code_expires_at,
         "currency": family.currency,
-        "members_count": family.members_count,
+        "members_count": family.active_members_count,
         "created_at": family.created_at,
         "updated_at": family.updated_at,
     }
@@ -47,163 +58,230 @@ def _serialize_family(family, include_members: bool = True):
                 "is_active": member.is_active,
                 "joined_at": member.joined_at,
             }
-            for member in family.members.filter(is_active=True)
+            for member in family.active_members
         ]
 
     return data
 
 
 def _get_family_queryset():
-    return Family.objects.annotate(
-        members_count=Count("members", filter=Q(members__is_active=True))
-    ).select_related("owner").prefetch_related("members__user")
+    return Family.objects.select_related("owner").prefetch_related(
+        Prefetch(
+            "members",
+            queryset=FamilyMember.objects.filter(is_active=True).select_related("user").only(
+                "id",
+                "family_id",
+                "role",
+                "is_active",
+                "joined_at",
+                "user__id",
+                "user__email",
+                "user__first_name",
+                "user__last_name",
+            ),
+            to_attr="active_members",
+        )
+    )
+
+
+def _get_user_families_queryset(user_id):
+    memberships = FamilyMember.objects.filter(user_id=user_id, is_active=True).values("family_id")
+
+    return Family.objects.filter(id__in=memberships).select_related("owner").order_by("-created_at", "-id")
+
+
+def _encode_cursor(family) -> str:
+    raw = f"{family.created_at.isoformat()}|{family.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
 
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, family_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(family_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HttpError(400, "Invalid cursor")
 
-@router.get("/", response=list[FamilyResponseSchema], auth=auth)
-def list_families(request):
+
+@router.get("/", response=FamilyPageSchema, auth=async_auth)
+@use_replica
+async def list_families(
+    request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+):
     user = request.auth
 
-    families = Family.objects.filter(
-        Q(owner=user) | Q(members__user=user, members__is_active=True)
-    ).annotate(
-        members_count=Count("members", filter=Q(members__is_active=True))
-    ).distinct().select_related("owner")
+    families = _get_user_families_queryset(user.id)
+    if cursor:
+        created_at, family_id = _decode_cursor(cursor)
+        families = families.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=family_id))
+
+    page = [family async for family in families[: limit + 1]]
+    next_cursor = _encode_cursor(page[limit - 1]) if len(page) > limit else None
 
-    return [_serialize_family(f, include_members=False) for f in families]
+    return {
+        "items": [_serialize_family(family, include_members=False) for family in page[:limit]],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("/", response=FamilyDetailSchema, auth=auth)
+@atomic_route()
 def create_family(request, payload: FamilyCreateSchema):
     user = request.auth
 
-    with transaction.atomic():
-        family = Family.objects.create(
-            name=payload.name,
-            description=payload.description or "",
-            owner=user,
-            currency=payload.currency,
-        )
+    family = Family.objects.create(
+        name=payload.name,
+        description=payload.description or "",
+        owner_id=user.id,
+        currency=payload.currency,
+        active_members_count=1,
+    )
 
-        FamilyMember.objects.create(
-            family=family,
-            user=user,
-            role=FamilyRole.OWNER,
-        )
+    FamilyMember.objects.create(
+        family=family,
+        user_id=user.id,
+        role=FamilyRole.OWNER,
+    )
 
     family = _get_family_queryset().get(id=family.id)
     return _serialize_family(family)
 
 
-@router.get("/{family_id}", response=FamilyDetailSchema, auth=auth)
-def get_family(request, family_id: UUID):
-    user = request.auth
-
-    family = get_object_or_404(
-        _get_family_queryset(),
-        Q(id=family_id) & (Q(owner=user) | Q(members__user=user, members__is_active=True))
-    )
+@router.get("/{uuid:family_id}", response=FamilyDetailSchema, auth=async_auth)
+@require_family_permission()
+@cache_response(family_response_version)
+async def get_family(request, family_id: UUID):
+    try:
+        family = await _get_family_queryset().aget(id=family_id)
+    except Family.DoesNotExist:
+        raise Http404("Family not found")
 
     return _serialize_family(family)
 
 
-@router.patch("/{family_id}", response=FamilyDetailSchema, auth=auth)
+@router.patch("/{uuid:family_id}", response=FamilyDetailSchema, auth=auth)
+@atomic_route()
 def update_family(request, family_id: UUID, payload: FamilyUpdateSchema):
     user = request.auth
 
-    family = get_object_or_404(Family, id=family_id, owner=user)
+    family = get_object_or_404(Family, id=family_id, owner_id=user.id)
 
-    for attr, value in payload.model_dump(exclude_unset=True).items():
+    changes = payload.model_dump(exclude_unset=True)
+    for attr, value in changes.items():
         setattr(family, attr, value)
 
-    family.save()
+    family.save(update_fields=[*changes, "updated_at"])
+    bump_data_version(family.id)
 
     family = _get_family_queryset().get(id=family.id)
     return _serialize_family(family)
 
 
 @router.post("/join", response=FamilyDetailSchema, auth=auth)
+@atomic_route()
 def join_family(request, payload: JoinFamilySchema):
     user = request.auth
 
     family = get_object_or_404(Family, invite_code=payload.invite_code)
 
-    if FamilyMember.objects.filter(family=family, user=user).exists():
+    if FamilyMember.objects.filter(family=family, user_id=user.id).exists():
         raise HttpError(400, "You are already a member of this family")
 
-    with transaction.atomic():
-        FamilyMember.objects.create(
-            family=family,
-            user=user,
-            role=FamilyRole.MEMBER,
-        )
+    FamilyMember.objects.create(
+        family=family,
+        user_id=user.id,
+        role=FamilyRole.MEMBER,
+    )
+    Family.objects.filter(id=family.id).update(active_members_count=F("active_members_count") + 1)
+    bump_acl_version(family.id)
+    bump_data_version(family.id)
+    publish_family_event(family.id, "member.joined", {"user_id": user.id})
 
     family = _get_family_queryset().get(id=family.id)
     return _serialize_family(family)
 
 
 @router.post("/{family_id}/regenerate-invite", auth=auth)
+@atomic_route()
 def regenerate_invite_code(request, family_id: UUID):
     user = request.auth
 
-    family = get_object_or_404(Family, id=family_id, owner=user)
+    family = get_object_or_404(Family, id=family_id, owner_id=user.id)
     family.regenerate_invite_code()
+    bump_data_version(family.id)
 
     return {"invite_code": family.invite_code}
 
 
 @router.patch("/{family_id}/members/{member_id}/role", auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.MANAGE)
 def update_member_role(request, family_id: UUID, member_id: UUID, payload: UpdateMemberRoleSchema):
-    user = request.auth
-
-    family = get_object_or_404(Family, id=family_id, owner=user)
-    member = get_object_or_404(FamilyMember, id=member_id, family=family)
+    member = get_object_or_404(FamilyMember.objects.select_related("family"), id=member_id, family_id=family_id)
 
-    if member.user == family.owner:
+    if member.user_id == member.family.owner_id:
         raise HttpError(400, "Cannot change owner role")
 
     member.role = payload.role
     member.save()
+    bump_acl_version(family_id)
+    bump_data_version(family_id)
+    publish_family_event(family_id, "member.role_changed", {"user_id": member.user_id, "role": member.role})
 
     return {"detail": "Member role updated successfully"}
 
 
 @router.delete("/{family_id}/members/{member_id}", auth=auth)
+@atomic_route()
+@require_family_permission(FamilyPermission.MANAGE)
 def remove_member(request, family_id: UUID, member_id: UUID):
-    user = request.auth
-
-    family = get_object_or_404(Family, id=family_id, owner=user)
-    member = get_object_or_404(FamilyMember, id=member_id, family=family)
+    member = get_object_or_404(FamilyMember.objects.select_related("family"), id=member_id, family_id=family_id)
 
-    if member.user == family.owner:
+    if member.user_id == member.family.owner_id:
         raise HttpError(400, "Cannot remove owner")
 
-    member.is_active = False
-    member.save()
+    removed = FamilyMember.objects.filter(id=member.id, is_active=True).update(
+        is_active=False, updated_at=timezone.now()
+    )
+    if removed:
+        Family.objects.filter(id=family_id).update(active_members_count=F("active_members_count") - 1)
+        bump_acl_version(family_id)
+        bump_data_version(family_id)
+        publish_family_event(family_id, "member.removed", {"user_id": member.user_id})
 
     return {"detail": "Member removed successfully"}
 
 
 @router.post("/{family_id}/leave", auth=auth)
+@atomic_route()
+@require_family_permission()
 def leave_family(request, family_id: UUID):
     user = request.auth
 
-    family = get_object_or_404(Family, id=family_id)
-
-    if family.owner == user:
+    if Family.objects.filter(id=family_id, owner_id=user.id).exists():
         raise HttpError(400, "Owner cannot leave family. Transfer ownership or delete the family.")
 
-    member = get_object_or_404(FamilyMember, family=family, user=user, is_active=True)
-    member.is_active = False
-    member.save()
+    left = FamilyMember.objects.filter(id=request.membership.member_id, is_active=True).update(
+        is_active=False, updated_at=timezone.now()
+    )
+    if left:
+        Family.objects.filter(id=family_id).update(active_members_count=F("active_members_count") - 1)
+        publish_family_event(family_id, "member.left", {"user_id": user.id})
+        bump_data_version(family_id)
+    bump_acl_version(family_id)
 
     return {"detail": "Successfully left the family"}
 
 
-@router.delete("/{family_id}", auth=auth)
+@router.delete("/{uuid:family_id}", auth=auth)
+@atomic_route()
 def delete_family(request, family_id: UUID):
     user = request.auth
 
-    family = get_object_or_404(Family, id=family_id, owner=user)
+    family = get_object_or_404(Family, id=family_id, owner_id=user.id)
     family.delete()
+    bump_acl_version(family_id)
 
     return {"detail": "Family deleted successfully"}
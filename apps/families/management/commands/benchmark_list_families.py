@@ -0,0 +1,102 @@
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from apps.families.api import _get_user_families_queryset
+from apps.families.models import Family, FamilyMember, FamilyRole
+from apps.users.models import User
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Seed families inside a rolled back transaction and time the list_families queries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--families", type=int, default=10_000)
+        parser.add_argument("--members", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=25_000)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if options["members"] < options["families"]:
+            raise CommandError("--members must be at least --families (every family has an owner member)")
+
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Seed data rolled back.")
+
+    def _run(self, options):
+        started = time.perf_counter()
+        users, families = self._seed(options["users"], options["families"], options["members"])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE users; ANALYZE families; ANALYZE family_members;")
+        self.stdout.write(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+        user = max(users, key=lambda u: u.family_count)
+        self.stdout.write(f"Probe user belongs to {user.family_count} families")
+
+        def legacy():
+            return list(
+                Family.objects.filter(Q(owner_id=user.id) | Q(members__user_id=user.id, members__is_active=True))
+                .annotate(members_count=Count("members", filter=Q(members__is_active=True)))
+                .distinct()
+                .select_related("owner")
+            )
+
+        def current():
+            return list(_get_user_families_queryset(user.id)[:500])
+
+        for name, query in (("legacy OR-join + DISTINCT", legacy), ("membership semi-join", current)):
+            query()
+            timings = []
+            for _ in range(options["runs"]):
+                t0 = time.perf_counter()
+                query()
+                timings.append((time.perf_counter() - t0) * 1000)
+            self.stdout.write(
+                f"{name}: median {statistics.median(timings):.2f}ms, max {max(timings):.2f}ms"
+            )
+
+    def _seed(self, users_count, families_count, members_count):
+        users = [
+            User(id=uuid.uuid4(), email=f"bench-{i}@example.com", first_name="Bench", last_name=str(i), password="!")
+            for i in range(users_count)
+        ]
+        User.objects.bulk_create(users, batch_size=5000)
+
+        families = []
+        memberships = []
+        for i in range(families_count):
+            owner = users[i % users_count]
+            family = Family(id=uuid.uuid4(), name=f"Bench family {i}", owner=owner, invite_code=f"{i:08X}")
+            families.append(family)
+            memberships.append(FamilyMember(family=family, user=owner, role=FamilyRole.OWNER))
+        Family.objects.bulk_create(families, batch_size=5000)
+
+        per_family = members_count // families_count
+        for family_index, family in enumerate(families):
+            for offset in range(1, per_family):
+                user = users[(family_index + offset * 7919) % users_count]
+                if user.id != family.owner_id:
+                    memberships.append(FamilyMember(family=family, user=user, is_active=offset % 10 != 0))
+        FamilyMember.objects.bulk_create(memberships, batch_size=5000, ignore_conflicts=True)
+
+        counts = dict(
+            FamilyMember.objects.filter(family__in=families, is_active=True)
+            .values_list("user_id")
+            .annotate(count=Count("id"))
+        )
+        for user in users:
+            user.family_count = counts.get(user.id, 0)
+
+        return users, families
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.families.models import Family, FamilyMember
+
+
+class Command(BaseCommand):
+    help = "Recompute Family.active_members_count for families whose stored value has drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        active_members = (
+            FamilyMember.objects.filter(family_id=OuterRef("pk"), is_active=True)
+            .order_by()
+            .values("family_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        drifted = Family.objects.annotate(
+            actual_members_count=Coalesce(Subquery(active_members), 0)
+        ).exclude(active_members_count=F("actual_members_count"))
+
+        if options["dry_run"]:
+            for family_id, stored, actual in drifted.values_list(
+                "id", "active_members_count", "actual_members_count"
+            ):
+                self.stdout.write(f"{family_id}: stored={stored} actual={actual}")
+            return
+
+        fixed = Family.objects.filter(id__in=drifted.values("id")).update(
+            active_members_count=Coalesce(Subquery(active_members), 0)
+        )
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {fixed} families"))
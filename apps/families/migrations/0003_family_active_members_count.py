@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:25
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_members_count(apps, schema_editor):
+    Family = apps.get_model('families', 'Family')
+    FamilyMember = apps.get_model('families', 'FamilyMember')
+
+    active_members = (
+        FamilyMember.objects.filter(family_id=OuterRef('pk'), is_active=True)
+        .order_by()
+        .values('family_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    Family.objects.update(active_members_count=Coalesce(Subquery(active_members), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('families', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='family',
+            name='active_members_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='active members count'),
+        ),
+        migrations.RunPython(backfill_active_members_count, migrations.RunPython.noop),
+    ]
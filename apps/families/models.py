@@ -1,6 +1,7 @@
 import secrets
 import string
 import uuid
+from enum import IntFlag
 
 from django.conf import settings
 from django.db import models
@@ -34,6 +35,7 @@ class Family(models.Model):
         null=True,
     )
     currency = models.CharField(_("currency"), max_length=3, default="RUB")
+    active_members_count = models.PositiveIntegerField(_("active members count"), default=0)
 
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -62,6 +64,20 @@ class FamilyRole(models.TextChoices):
     MEMBER = "member", _("Member")
     VIEWER = "viewer", _("Viewer")
 
+class FamilyPermission(IntFlag):
+
+    VIEW = 1
+    ADD = 2
+    EDIT = 4
+    DELETE = 8
+    MANAGE = 16
+
+ROLE_PERMISSIONS = {
+    FamilyRole.OWNER: FamilyPermission.VIEW | FamilyPermission.ADD | FamilyPermission.EDIT | FamilyPermission.DELETE | FamilyPermission.MANAGE,
+    FamilyRole.MEMBER: FamilyPermission.VIEW | FamilyPermission.ADD | FamilyPermission.EDIT,
+    FamilyRole.VIEWER: FamilyPermission.VIEW,
+}
+
 class FamilyMember(models.Model):
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -105,9 +121,5 @@ class FamilyMember(models.Model):
 
     def has_permission(self, permission: str) -> bool:
 
-        permissions_map = {
-            FamilyRole.OWNER: ["view", "add", "edit", "delete", "manage"],
-            FamilyRole.MEMBER: ["view", "add", "edit"],
-            FamilyRole.VIEWER: ["view"],
-        }
-        return permission in permissions_map.get(self.role, [])
+        flag = FamilyPermission.__members__.get(permission.upper())
+        return flag is not None and flag in ROLE_PERMISSIONS.get(self.role, FamilyPermission(0))
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from functools import wraps
+from typing import Optional
+from uuid import UUID
+
+from asgiref.sync import iscoroutinefunction
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
+from ninja.errors import HttpError
+
+from household_manager.cache import LocalTTLCache, bump_version, get_version
+
+from .models import ROLE_PERMISSIONS, FamilyMember, FamilyPermission
+
+ACL_VERSION_KEY = "family:{family_id}:acl_version"
+ACL_ENTRY_KEY = "family:{family_id}:acl:{version}:{user_id}"
+
+_local_versions = LocalTTLCache(maxsize=10000, ttl=settings.FAMILY_ACL_VERSION_LOCAL_TTL)
+_local_memberships = LocalTTLCache(maxsize=50000, ttl=settings.FAMILY_ACL_LOCAL_TTL)
+
+
+@dataclass(frozen=True)
+class Membership:
+    family_id: UUID
+    user_id: UUID
+    member_id: UUID
+    role: str
+    permissions: FamilyPermission
+
+    def has(self, permission: FamilyPermission) -> bool:
+        return permission in self.permissions
+
+
+def get_acl_version(family_id) -> int:
+    key = str(family_id)
+    version = _local_versions.get(key)
+    if version is None:
+        version = get_version(ACL_VERSION_KEY.format(family_id=key))
+        _local_versions.set(key, version)
+    return version
+
+
+def bump_acl_version(family_id) -> None:
+    def _bump():
+        bump_version(ACL_VERSION_KEY.format(family_id=family_id))
+        _local_versions.delete(str(family_id))
+
+    transaction.on_commit(_bump)
+
+
+def _membership(user_id, family_id, entry) -> Optional[Membership]:
+    if not entry:
+        return None
+
+    member_id, role = entry
+    return Membership(
+        family_id=family_id,
+        user_id=user_id,
+        member_id=member_id,
+        role=role,
+        permissions=ROLE_PERMISSIONS.get(role, FamilyPermission(0)),
+    )
+
+
+def resolve_membership(user_id, family_id) -> Optional[Membership]:
+    version = get_acl_version(family_id)
+    local_key = (str(family_id), version, str(user_id))
+
+    entry = _local_memberships.get(local_key)
+    if entry is None:
+        cache_key = ACL_ENTRY_KEY.format(family_id=family_id, version=version, user_id=user_id)
+        entry = cache.get(cache_key)
+        if entry is None:
+            row = (
+                FamilyMember.objects.filter(family_id=family_id, user_id=user_id, is_active=True)
+                .values_list("id", "role")
+                .first()
+            )
+            entry = row or ()
+            cache.set(cache_key, entry, settings.FAMILY_ACL_CACHE_TIMEOUT)
+        _local_memberships.set(local_key, entry)
+
+    return _membership(user_id, family_id, entry)
+
+
+async def aresolve_membership(user_id, family_id) -> Optional[Membership]:
+    version = _local_versions.get(str(family_id))
+    if version is not None:
+        entry = _local_memberships.get((str(family_id), version, str(user_id)))
+        if entry is not None:
+            return _membership(user_id, family_id, entry)
+    return await database_sync_to_async(resolve_membership)(user_id, family_id)
+
+
+async def get_connection_membership(scope, family_id) -> Optional[Membership]:
+    memberships = scope.setdefault("memberships", {})
+    key = str(family_id)
+    if key not in memberships:
+        memberships[key] = await aresolve_membership(scope["user"].id, family_id)
+    return memberships[key]
+
+
+def _check_membership(membership: Optional[Membership], permission: FamilyPermission, message: str) -> Membership:
+    if membership is None:
+        raise Http404("Family not found")
+    if not membership.has(permission):
+        raise HttpError(403, message)
+    return membership
+
+
+def require_family_permission(
+    permission: FamilyPermission = FamilyPermission.VIEW,
+    message: str = "You don't have permission to perform this action",
+):
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                membership = await aresolve_membership(request.auth.id, kwargs["family_id"])
+                request.membership = _check_membership(membership, permission, message)
+                return await view_func(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            membership = resolve_membership(request.auth.id, kwargs["family_id"])
+            request.membership = _check_membership(membership, permission, message)
+            return view_func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -41,6 +41,11 @@ class FamilyResponseSchema(Schema):
     created_at: datetime
     updated_at: datetime
 
+class FamilyPageSchema(Schema):
+
+    items: List[FamilyResponseSchema]
+    next_cursor: Optional[str] = None
+
 class FamilyDetailSchema(FamilyResponseSchema):
 
     members: List[FamilyMemberSchema]
@@ -51,7 +56,7 @@ class JoinFamilySchema(Schema):
 
 class UpdateMemberRoleSchema(Schema):
 
-    role: str = Field(..., pattern="^(owner|member|viewer)$")
+    role: str = Field(..., pattern="^(member|viewer)$")
 
 class RemoveMemberSchema(Schema):
 
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.families.models import Family, FamilyMember, FamilyRole
+from apps.users.api import get_tokens_for_user
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+MEMBERS = 8
+
+
+def _user(email):
+    return User.objects.create_user(email=email, password="pass12345!", first_name="Test", last_name="User")
+
+
+def _family(owner, members):
+    family = Family.objects.create(name="Family", owner=owner, active_members_count=members)
+    FamilyMember.objects.create(family=family, user=owner, role=FamilyRole.OWNER)
+    for index in range(members - 1):
+        FamilyMember.objects.create(family=family, user=_user(f"member{index}-{family.id}@example.com"))
+    return family
+
+
+def _request(client, method, path, user, payload=None):
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {get_tokens_for_user(user)['access']}"}
+    if payload is None:
+        return getattr(client, method)(path, **headers)
+    return getattr(client, method)(path, data=json.dumps(payload), content_type="application/json", **headers)
+
+
+def _authenticated(client, email):
+    user = _user(email)
+    assert _request(client, "get", "/api/users/me", user).status_code == 200
+    return user
+
+
+def _count_queries(client, method, path, user, payload=None):
+    with CaptureQueriesContext(connection) as context:
+        response = _request(client, method, path, user, payload)
+    assert response.status_code == 200, response.content
+    return len(context.captured_queries)
+
+
+def test_get_family_queries_do_not_grow_with_members(client, django_assert_num_queries):
+    owner = _authenticated(client, "owner@example.com")
+    small, large = _family(owner, 1), _family(owner, MEMBERS)
+
+    expected = _count_queries(client, "get", f"/api/families/{small.id}", owner)
+    with django_assert_num_queries(expected):
+        response = _request(client, "get", f"/api/families/{large.id}", owner)
+
+    assert len(response.json()["members"]) == MEMBERS
+
+
+def test_update_family_queries_do_not_grow_with_members(client, django_assert_num_queries):
+    owner = _authenticated(client, "owner@example.com")
+    small, large = _family(owner, 1), _family(owner, MEMBERS)
+
+    expected = _count_queries(client, "patch", f"/api/families/{small.id}", owner, {"name": "Renamed"})
+    with django_assert_num_queries(expected):
+        response = _request(client, "patch", f"/api/families/{large.id}", owner, {"name": "Renamed"})
+
+    assert response.json()["name"] == "Renamed"
+    assert len(response.json()["members"]) == MEMBERS
+
+
+def test_join_family_queries_do_not_grow_with_members(client, django_assert_num_queries):
+    owner = _user("owner@example.com")
+    small, large = _family(owner, 1), _family(owner, MEMBERS)
+    first, second = _authenticated(client, "first@example.com"), _authenticated(client, "second@example.com")
+
+    expected = _count_queries(client, "post", "/api/families/join", first, {"invite_code": small.invite_code})
+    with django_assert_num_queries(expected):
+        response = _request(client, "post", "/api/families/join", second, {"invite_code": large.invite_code})
+
+    assert len(response.json()["members"]) == MEMBERS + 1
+
+
+def test_create_family_queries_do_not_grow_with_memberships(client, django_assert_num_queries):
+    newcomer = _authenticated(client, "newcomer@example.com")
+    member = _authenticated(client, "member@example.com")
+    FamilyMember.objects.create(family=_family(_user("owner@example.com"), MEMBERS), user=member)
+
+    expected = _count_queries(client, "post", "/api/families/", newcomer, {"name": "Family"})
+    with django_assert_num_queries(expected):
+        response = _request(client, "post", "/api/families/", member, {"name": "Family"})
+
+    assert len(response.json()["members"]) == 1
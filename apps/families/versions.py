@@ -0,0 +1,17 @@
+from django.db import transaction
+
+from household_manager.cache import bump_version, get_version
+
+DATA_VERSION_KEY = "family:{family_id}:data_version"
+
+
+def get_data_version(family_id) -> int:
+    return get_version(DATA_VERSION_KEY.format(family_id=family_id))
+
+
+def bump_data_version(family_id) -> None:
+    transaction.on_commit(lambda: bump_version(DATA_VERSION_KEY.format(family_id=family_id)))
+
+
+def family_response_version(request, family_id, **kwargs) -> str:
+    return f"family:{family_id}:{get_data_version(family_id)}"
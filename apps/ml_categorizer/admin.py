@@ -1 +1,10 @@
 from django.contrib import admin
+
+from .models import CategorizerVersion
+
+@admin.register(CategorizerVersion)
+class CategorizerVersionAdmin(admin.ModelAdmin):
+
+    list_display = ["version", "kind", "trained_until", "samples", "duration_ms", "created_at"]
+    list_filter = ["kind"]
+    readonly_fields = ["version", "kind", "trained_until", "samples", "duration_ms", "created_at"]
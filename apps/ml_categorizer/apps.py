@@ -4,3 +4,7 @@ class MlCategorizerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.ml_categorizer"
     verbose_name = "ML Categorizer"
+
+    def ready(self):
+
+        from . import signals  # noqa: F401
@@ -0,0 +1,56 @@
+from django.db.models import Q
+
+from apps.categories.models import Category
+from apps.expenses.models import CategorySource
+
+from .merchants import lookup_categories, normalize_merchant
+from .service import expense_text, predict_many
+
+
+def type_categories(family_id) -> dict:
+    mapping = {}
+    rows = (
+        Category.objects.filter(Q(family_id=family_id) | Q(is_default=True))
+        .order_by("created_at")
+        .values_list("type", "id", "family_id")
+    )
+    for category_type, category_id, owner_id in rows:
+        if category_type not in mapping or (owner_id is not None and mapping[category_type][1] is None):
+            mapping[category_type] = (category_id, owner_id)
+    return {category_type: category_id for category_type, (category_id, _) in mapping.items()}
+
+
+def suggest_categories(expenses) -> dict:
+    assignments = {source: {} for source in (CategorySource.MERCHANT, CategorySource.MODEL)}
+
+    by_family = {}
+    for expense in expenses:
+        by_family.setdefault(expense.family_id, []).append(expense)
+
+    remaining = []
+    for family_id, family_expenses in by_family.items():
+        known = lookup_categories(family_id, [expense.merchant for expense in family_expenses])
+        for expense in family_expenses:
+            category_id = known.get(normalize_merchant(expense.merchant))
+            if category_id is not None:
+                assignments[CategorySource.MERCHANT][expense.id] = category_id
+            else:
+                remaining.append(expense)
+
+    candidates = [
+        (expense, text)
+        for expense in remaining
+        if (text := expense_text(expense.merchant, expense.description))
+    ]
+    predictions = predict_many([text for _, text in candidates])
+
+    family_categories = {}
+    for (expense, _), prediction in zip(candidates, predictions):
+        if prediction is None:
+            continue
+        if expense.family_id not in family_categories:
+            family_categories[expense.family_id] = type_categories(expense.family_id)
+        category_id = family_categories[expense.family_id].get(prediction.category_type)
+        if category_id is not None:
+            assignments[CategorySource.MODEL][expense.id] = category_id
+    return assignments
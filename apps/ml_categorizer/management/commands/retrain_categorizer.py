@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.ml_categorizer.training import retrain
+
+
+class Command(BaseCommand):
+    help = "Update the category classifier incrementally, or retrain it from scratch with --full."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true")
+
+    def handle(self, *args, **options):
+        version = retrain(full=options["full"])
+        if version is None:
+            self.stdout.write("Nothing to do")
+        else:
+            self.stdout.write(f"Published {version} trained on {version.samples} samples")
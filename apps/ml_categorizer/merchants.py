@@ -0,0 +1,137 @@
+import logging
+import re
+from typing import Iterable
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError, TimeoutError
+
+from apps.expenses.models import CategorySource, Expense
+from household_manager.cache import LocalTTLCache
+
+logger = logging.getLogger(__name__)
+
+INDEX_KEY = "household:merchant_index:{family_id}"
+BUILT_FIELD = "__built__"
+
+LEGAL_FORMS_RE = re.compile(r"\b(ооо|оао|зао|пао|ао|ип|llc|ltd|inc|gmbh)\b")
+NOISE_RE = re.compile(r"[^\w]+|\d+|_")
+
+_local_index = LocalTTLCache(
+    maxsize=settings.ML_MERCHANT_INDEX_LOCAL_MAXSIZE,
+    ttl=settings.ML_MERCHANT_INDEX_LOCAL_TTL,
+)
+
+
+def normalize_merchant(merchant: str) -> str:
+    value = (merchant or "").lower().replace("ё", "е")
+    value = LEGAL_FORMS_RE.sub(" ", value)
+    return " ".join(NOISE_RE.sub(" ", value).split())
+
+
+def _index_key(family_id) -> str:
+    return INDEX_KEY.format(family_id=family_id)
+
+
+def build_index(family_id) -> dict[str, str]:
+    rows = (
+        Expense.objects.filter(family_id=family_id, category_source=CategorySource.MANUAL, category__isnull=False)
+        .exclude(merchant="")
+        .order_by()
+        .values("merchant", "category_id")
+        .annotate(uses=Count("id"), last_used=Max("updated_at"))
+    )
+
+    best = {}
+    for row in rows:
+        merchant = normalize_merchant(row["merchant"])
+        if not merchant:
+            continue
+        score = (row["uses"], row["last_used"])
+        if merchant not in best or score > best[merchant][0]:
+            best[merchant] = (score, str(row["category_id"]))
+
+    index = {merchant: category_id for merchant, (_, category_id) in best.items()}
+
+    key = _index_key(family_id)
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping={BUILT_FIELD: "1", **index})
+        pipe.expire(key, settings.ML_MERCHANT_INDEX_TIMEOUT)
+        pipe.execute()
+    except (ConnectionError, TimeoutError):
+        logger.warning("Redis is unavailable, merchant index for family %s is not stored", family_id)
+    return index
+
+
+def lookup_categories(family_id, merchants: Iterable[str]) -> dict[str, UUID]:
+    found, missing = {}, []
+    for merchant in {normalize_merchant(merchant) for merchant in merchants} - {""}:
+        category_id = _local_index.get((str(family_id), merchant))
+        if category_id is None:
+            missing.append(merchant)
+        elif category_id:
+            found[merchant] = UUID(category_id)
+
+    if not missing:
+        return found
+
+    key = _index_key(family_id)
+    try:
+        redis = get_redis_connection("default")
+        values = redis.hmget(key, missing) if redis.exists(key) else None
+    except (ConnectionError, TimeoutError):
+        logger.warning("Redis is unavailable, reading merchant index for family %s from the database", family_id)
+        values = None
+
+    if values is None:
+        index = build_index(family_id)
+        values = [index.get(merchant) for merchant in missing]
+    else:
+        values = [value.decode() if value else None for value in values]
+
+    for merchant, category_id in zip(missing, values):
+        _local_index.set((str(family_id), merchant), category_id or "")
+        if category_id:
+            found[merchant] = UUID(category_id)
+    return found
+
+
+def remember_categories(family_id, pairs: Iterable[tuple[str, UUID]]) -> None:
+    mapping = {
+        merchant: str(category_id)
+        for merchant, category_id in ((normalize_merchant(name), category_id) for name, category_id in pairs)
+        if merchant and category_id
+    }
+    if not mapping:
+        return
+
+    def _remember():
+        key = _index_key(family_id)
+        try:
+            redis = get_redis_connection("default")
+            if redis.exists(key):
+                redis.hset(key, mapping=mapping)
+        except (ConnectionError, TimeoutError):
+            logger.warning("Redis is unavailable, merchant index for family %s is not updated", family_id)
+        for merchant, category_id in mapping.items():
+            _local_index.set((str(family_id), merchant), category_id)
+
+    transaction.on_commit(_remember, robust=True)
+
+
+def forget_index(family_id=None) -> None:
+    try:
+        redis = get_redis_connection("default")
+        if family_id is not None:
+            redis.delete(_index_key(family_id))
+        else:
+            for key in redis.scan_iter(match=INDEX_KEY.format(family_id="*"), count=1000):
+                redis.delete(key)
+    except (ConnectionError, TimeoutError):
+        logger.warning("Redis is unavailable, merchant index is only cleared locally")
+    _local_index.clear()
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategorizerVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(unique=True, verbose_name='version')),
+                ('kind', models.CharField(choices=[('full', 'Full retrain'), ('incremental', 'Incremental update')], max_length=12, verbose_name='kind')),
+                ('trained_until', models.DateTimeField(verbose_name='trained until')),
+                ('samples', models.PositiveIntegerField(default=0, verbose_name='samples')),
+                ('duration_ms', models.PositiveIntegerField(default=0, verbose_name='duration, ms')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'categorizer version',
+                'verbose_name_plural': 'categorizer versions',
+                'db_table': 'ml_categorizer_versions',
+                'ordering': ['-version'],
+            },
+        ),
+    ]
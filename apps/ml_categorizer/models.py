@@ -0,0 +1,25 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+class TrainingKind(models.TextChoices):
+
+    FULL = "full", _("Full retrain")
+    INCREMENTAL = "incremental", _("Incremental update")
+
+class CategorizerVersion(models.Model):
+
+    version = models.PositiveIntegerField(_("version"), unique=True)
+    kind = models.CharField(_("kind"), max_length=12, choices=TrainingKind.choices)
+    trained_until = models.DateTimeField(_("trained until"))
+    samples = models.PositiveIntegerField(_("samples"), default=0)
+    duration_ms = models.PositiveIntegerField(_("duration, ms"), default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "ml_categorizer_versions"
+        verbose_name = _("categorizer version")
+        verbose_name_plural = _("categorizer versions")
+        ordering = ["-version"]
+
+    def __str__(self):
+        return f"v{self.version} ({self.kind})"
@@ -0,0 +1,184 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+import joblib
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from .models import CategorizerVersion
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION_KEY = "ml:categorizer:version"
+
+
+@dataclass(frozen=True)
+class Prediction:
+    category_type: str
+    confidence: float
+
+
+@dataclass(frozen=True)
+class CategorizerModel:
+    vectorizer: object
+    classifier: object
+
+    def predict(self, texts: list[str]) -> list[Optional[Prediction]]:
+        features = self.vectorizer.transform(texts)
+        probabilities = self.classifier.predict_proba(features)
+        best = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(texts)), best]
+        labels = self.classifier.classes_[best]
+
+        return [
+            Prediction(category_type=str(label), confidence=float(confidence))
+            if confidence >= settings.ML_MIN_CONFIDENCE
+            else None
+            for label, confidence in zip(labels, confidences)
+        ]
+
+
+def expense_text(merchant: str, description: str) -> str:
+    return f"{merchant or ''} {description or ''}".strip().lower()
+
+
+def current_model_version() -> Optional[int]:
+    version = cache.get(MODEL_VERSION_KEY)
+    if version is None:
+        version = CategorizerVersion.objects.values_list("version", flat=True).first()
+        if version is not None:
+            cache.set(MODEL_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def load_model() -> Optional[CategorizerModel]:
+    if not (os.path.exists(settings.ML_MODEL_PATH) and os.path.exists(settings.ML_VECTORIZER_PATH)):
+        logger.warning("Categorizer artifacts are missing, predictions are disabled")
+        return None
+
+    return CategorizerModel(
+        vectorizer=joblib.load(settings.ML_VECTORIZER_PATH, mmap_mode="r"),
+        classifier=joblib.load(settings.ML_MODEL_PATH, mmap_mode="r"),
+    )
+
+
+class _ModelHolder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._model = None
+        self._version = None
+        self._check_at = 0.0
+
+    def _stale(self) -> bool:
+        return self._pid != os.getpid() or time.monotonic() >= self._check_at
+
+    def get(self) -> Optional[CategorizerModel]:
+        if self._stale():
+            with self._lock:
+                if self._stale():
+                    version = current_model_version()
+                    if self._pid != os.getpid() or version != self._version:
+                        self._model = load_model()
+                        self._version = version
+                        logger.info("Loaded categorizer model version %s", version)
+                    self._pid = os.getpid()
+                    self._check_at = time.monotonic() + settings.ML_MODEL_CHECK_INTERVAL
+        return self._model
+
+    def reload(self) -> None:
+        with self._lock:
+            self._version = current_model_version()
+            self._model = load_model()
+            self._pid = os.getpid()
+            self._check_at = time.monotonic() + settings.ML_MODEL_CHECK_INTERVAL
+
+
+class MicroBatcher:
+    def __init__(self, handler, window_ms: int, max_batch: int):
+        self.handler = handler
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+
+    def submit(self, item) -> Future:
+        future = Future()
+        self._ensure_worker().put((item, future))
+        return future
+
+    def _ensure_worker(self) -> queue.SimpleQueue:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    threading.Thread(target=self._run, args=(self._queue,), daemon=True).start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def _run(self, requests: queue.SimpleQueue) -> None:
+        while True:
+            batch = [requests.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            items, futures = zip(*batch)
+            try:
+                results = self.handler(list(items))
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                continue
+            finally:
+                close_old_connections()
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+
+_model = _ModelHolder()
+
+
+def _predict_batch(texts: list[str]) -> list[Optional[Prediction]]:
+    model = _model.get()
+    if model is None:
+        return [None] * len(texts)
+    return model.predict(texts)
+
+
+_batcher = MicroBatcher(
+    _predict_batch,
+    window_ms=settings.ML_BATCH_WINDOW_MS,
+    max_batch=settings.ML_PREDICT_BATCH_SIZE,
+)
+
+
+def predict(text: str, timeout: float = 2.0) -> Optional[Prediction]:
+    return _batcher.submit(text).result(timeout=timeout)
+
+
+def predict_many(texts: list[str]) -> list[Optional[Prediction]]:
+    batch_size = settings.ML_PREDICT_BATCH_SIZE
+    predictions = []
+    for start in range(0, len(texts), batch_size):
+        predictions.extend(_predict_batch(texts[start:start + batch_size]))
+    return predictions
+
+
+def reload_model() -> None:
+    _model.reload()
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.categories.models import Category
+
+from .merchants import forget_index
+
+
+@receiver(post_delete, sender=Category)
+def drop_merchant_index(sender, instance, **kwargs):
+    transaction.on_commit(lambda: forget_index(instance.family_id), robust=True)
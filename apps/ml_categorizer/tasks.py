@@ -0,0 +1,36 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def categorize_expenses(expense_ids):
+    from apps.expenses.models import Expense
+    from apps.expenses.services import assign_categories
+
+    from .categorize import suggest_categories
+
+    expenses = (
+        Expense.objects.filter(id__in=expense_ids, category__isnull=True)
+        .only("id", "family_id", "merchant", "description")
+    )
+    assignments = suggest_categories(list(expenses))
+    assigned = sum(assign_categories(chosen, source) for source, chosen in assignments.items())
+
+    logger.info("Categorized %s of %s expenses", assigned, len(expense_ids))
+    return assigned
+
+
+@shared_task(ignore_result=True)
+def retrain_categorization_model(full=False):
+    from .training import retrain
+
+    version = retrain(full=full)
+    if version is None:
+        logger.info("Categorizer retrain skipped: nothing new to learn or another run in progress")
+        return None
+
+    logger.info("Published categorizer %s trained on %s samples", version, version.samples)
+    return version.version
@@ -0,0 +1,162 @@
+import logging
+import os
+import tempfile
+import time
+from datetime import timedelta
+from typing import Optional
+
+import joblib
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from apps.categories.models import CategoryType
+from apps.expenses.models import CategorySource, Expense
+
+from .models import CategorizerVersion, TrainingKind
+from .service import MODEL_VERSION_KEY, expense_text
+
+logger = logging.getLogger(__name__)
+
+TRAINING_LOCK_KEY = "ml:categorizer:training"
+FULL_RETRAIN_EPOCHS = 3
+
+
+def build_vectorizer() -> HashingVectorizer:
+    return HashingVectorizer(
+        analyzer="char_wb",
+        ngram_range=(2, 4),
+        n_features=2**20,
+        alternate_sign=False,
+        norm="l2",
+    )
+
+
+def build_classifier() -> SGDClassifier:
+    return SGDClassifier(loss="log_loss", alpha=1e-5, random_state=0)
+
+
+def labeled_expenses(since=None, until=None):
+    expenses = Expense.objects.filter(category_source=CategorySource.MANUAL, category__isnull=False)
+    if since is not None:
+        expenses = expenses.filter(updated_at__gt=since)
+    if until is not None:
+        expenses = expenses.filter(updated_at__lte=until)
+    return expenses.order_by().values_list("merchant", "description", "category__type")
+
+
+def _chunks(rows, chunk_size: int):
+    texts, labels = [], []
+    for merchant, description, label in rows.iterator(chunk_size=chunk_size):
+        text = expense_text(merchant, description)
+        if not text:
+            continue
+        texts.append(text)
+        labels.append(label)
+        if len(texts) >= chunk_size:
+            yield texts, labels
+            texts, labels = [], []
+    if texts:
+        yield texts, labels
+
+
+def _partial_fit(vectorizer, classifier, rows, shuffle_seed: Optional[int] = None) -> int:
+    classes = np.array(CategoryType.values)
+    rng = np.random.default_rng(shuffle_seed)
+    samples = 0
+
+    for texts, labels in _chunks(rows, settings.ML_TRAINING_CHUNK_SIZE):
+        order = rng.permutation(len(texts)) if shuffle_seed is not None else np.arange(len(texts))
+        features = vectorizer.transform([texts[index] for index in order])
+        classifier.partial_fit(features, np.array(labels)[order], classes=classes)
+        samples += len(texts)
+    return samples
+
+
+def _atomic_dump(obj, path) -> None:
+    directory = os.path.dirname(str(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(obj, tmp_path)
+        with open(tmp_path, "rb") as tmp_file:
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _publish(kind: str, trained_until, samples: int, started: float) -> CategorizerVersion:
+    with transaction.atomic():
+        latest = CategorizerVersion.objects.select_for_update().aggregate(latest=Max("version"))["latest"] or 0
+        version = CategorizerVersion.objects.create(
+            version=latest + 1,
+            kind=kind,
+            trained_until=trained_until,
+            samples=samples,
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+        transaction.on_commit(lambda: cache.set(MODEL_VERSION_KEY, version.version, timeout=None))
+    return version
+
+
+def _training_cutoff():
+    return timezone.now() - timedelta(seconds=settings.ML_TRAINING_COMMIT_MARGIN)
+
+
+def full_retrain() -> Optional[CategorizerVersion]:
+    started = time.perf_counter()
+    until = _training_cutoff()
+    vectorizer, classifier = build_vectorizer(), build_classifier()
+
+    samples = 0
+    for epoch in range(FULL_RETRAIN_EPOCHS):
+        samples = _partial_fit(vectorizer, classifier, labeled_expenses(until=until), shuffle_seed=epoch)
+    if not samples:
+        logger.info("No labeled expenses to train the categorizer on, skipping the full retrain")
+        return None
+
+    _atomic_dump(vectorizer, settings.ML_VECTORIZER_PATH)
+    _atomic_dump(classifier, settings.ML_MODEL_PATH)
+    return _publish(TrainingKind.FULL, until, samples, started)
+
+
+def incremental_update(checkpoint: CategorizerVersion) -> Optional[CategorizerVersion]:
+    started = time.perf_counter()
+    until = _training_cutoff()
+    vectorizer = joblib.load(settings.ML_VECTORIZER_PATH)
+    classifier = joblib.load(settings.ML_MODEL_PATH)
+
+    samples = _partial_fit(vectorizer, classifier, labeled_expenses(since=checkpoint.trained_until, until=until))
+    if not samples:
+        return None
+
+    _atomic_dump(classifier, settings.ML_MODEL_PATH)
+    return _publish(TrainingKind.INCREMENTAL, until, samples, started)
+
+
+def retrain(full: bool = False) -> Optional[CategorizerVersion]:
+    if not cache.add(TRAINING_LOCK_KEY, 1, timeout=settings.ML_TRAINING_LOCK_TIMEOUT):
+        return None
+
+    try:
+        checkpoint = CategorizerVersion.objects.first()
+        last_full = CategorizerVersion.objects.filter(kind=TrainingKind.FULL).first()
+        full_due = (
+            last_full is None
+            or not os.path.exists(settings.ML_MODEL_PATH)
+            or last_full.created_at < timezone.now() - timedelta(days=settings.ML_FULL_RETRAIN_INTERVAL_DAYS)
+        )
+        if full or full_due:
+            return full_retrain()
+        return incremental_update(checkpoint)
+    finally:
+        cache.delete(TRAINING_LOCK_KEY)
@@ -0,0 +1,71 @@
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from apps.families.permissions import get_connection_membership
+
+from .events import family_group_name, user_group_name
+
+MEMBERSHIP_REVOKED_EVENTS = {"member.removed", "member.left"}
+
+
+class FamilyEventsConsumer(AsyncJsonWebsocketConsumer):
+    group_name = None
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=4401)
+            return
+
+        family_id = self.scope["url_route"]["kwargs"]["family_id"]
+        membership = await get_connection_membership(self.scope, family_id)
+        if membership is None:
+            await self.close(code=4403)
+            return
+
+        self.user_id = str(user.id)
+        self.group_name = family_group_name(family_id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept(subprotocol=self.scope.get("auth_subprotocol"))
+
+    async def disconnect(self, code):
+        if self.group_name:
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get("type") == "ping":
+            await self.send_json({"type": "pong"})
+
+    async def family_events(self, message):
+        await self.send_json({"type": "events", "events": message["events"], "dropped": message["dropped"]})
+
+        revoked = any(
+            event["type"] in MEMBERSHIP_REVOKED_EVENTS and event["payload"].get("user_id") == self.user_id
+            for event in message["events"]
+        )
+        if revoked:
+            await self.close(code=4403)
+
+
+class UserNotificationsConsumer(AsyncJsonWebsocketConsumer):
+    group_name = None
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=4401)
+            return
+
+        self.group_name = user_group_name(user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept(subprotocol=self.scope.get("auth_subprotocol"))
+
+    async def disconnect(self, code):
+        if self.group_name:
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        if content.get("type") == "ping":
+            await self.send_json({"type": "pong"})
+
+    async def user_notification(self, message):
+        await self.send_json({"type": "notification", "subject": message["subject"], "body": message["body"]})
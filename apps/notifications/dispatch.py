@@ -0,0 +1,170 @@
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import httpx
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django_redis import get_redis_connection
+
+from apps.telegram_bot.client import bot_client
+
+from .events import user_group_name
+from .tasks import deliver_notifications
+
+logger = logging.getLogger(__name__)
+
+EMAIL = "email"
+TELEGRAM = "telegram"
+WEBSOCKET = "websocket"
+ALL_CHANNELS = (EMAIL, TELEGRAM, WEBSOCKET)
+
+TELEGRAM_BUCKET_KEY = "household:telegram_bucket"
+
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return wait
+"""
+
+
+@dataclass(frozen=True)
+class Notification:
+    user_id: str
+    subject: str
+    body: str
+    channels: tuple[str, ...] = ALL_CHANNELS
+
+
+def route_notifications(notifications: Iterable[Notification]) -> dict[str, list[dict]]:
+    notifications = list(notifications)
+    users = (
+        get_user_model()
+        .objects.filter(id__in={notification.user_id for notification in notifications}, is_active=True)
+        .values("id", "email", "telegram_id", "email_notifications_enabled", "telegram_notifications_enabled")
+    )
+    users = {str(user["id"]): user for user in users}
+
+    deliveries = defaultdict(list)
+    for notification in notifications:
+        user = users.get(str(notification.user_id))
+        if user is None:
+            continue
+
+        addresses = {
+            EMAIL: user["email"] if user["email_notifications_enabled"] else None,
+            TELEGRAM: user["telegram_id"] if user["telegram_notifications_enabled"] else None,
+            WEBSOCKET: str(user["id"]),
+        }
+        for channel in notification.channels:
+            if addresses[channel]:
+                deliveries[channel].append(
+                    {"address": addresses[channel], "subject": notification.subject, "body": notification.body}
+                )
+    return deliveries
+
+
+def dispatch_notifications(notifications: Iterable[Notification], window: Optional[int] = None) -> int:
+    window = settings.NOTIFICATIONS_SPREAD_WINDOW if window is None else window
+    batch_size = settings.NOTIFICATIONS_BATCH_SIZE
+
+    batches = [
+        (channel, deliveries[start:start + batch_size])
+        for channel, deliveries in route_notifications(notifications).items()
+        for start in range(0, len(deliveries), batch_size)
+    ]
+    for index, (channel, batch) in enumerate(batches):
+        deliver_notifications.apply_async((channel, batch), countdown=window * index / len(batches))
+    return sum(len(batch) for _, batch in batches)
+
+
+def send_email_batch(deliveries: list[dict]) -> int:
+    with get_connection(fail_silently=True) as connection:
+        messages = [
+            EmailMessage(
+                delivery["subject"],
+                delivery["body"],
+                settings.DEFAULT_FROM_EMAIL,
+                [delivery["address"]],
+                connection=connection,
+            )
+            for delivery in deliveries
+        ]
+        return connection.send_messages(messages) or 0
+
+
+def acquire_telegram_token() -> None:
+    redis = get_redis_connection("default")
+    script = redis.register_script(_TOKEN_BUCKET_LUA)
+    while wait_ms := script(keys=[TELEGRAM_BUCKET_KEY], args=[settings.TELEGRAM_RATE_LIMIT, settings.TELEGRAM_BURST]):
+        time.sleep(wait_ms / 1000)
+
+
+def _send_telegram_message(client: httpx.Client, delivery: dict) -> bool:
+    payload = {"chat_id": delivery["address"], "text": f"{delivery['subject']}\n\n{delivery['body']}"}
+    for _ in range(2):
+        acquire_telegram_token()
+        try:
+            response = client.post("/sendMessage", json=payload)
+        except httpx.HTTPError:
+            logger.exception("Telegram sendMessage to %s failed", delivery["address"])
+            return False
+        if response.status_code != 429:
+            break
+        time.sleep(response.json().get("parameters", {}).get("retry_after", 1))
+
+    if not response.is_success:
+        logger.warning("Telegram sendMessage to %s returned %s", delivery["address"], response.status_code)
+    return response.is_success
+
+
+def send_telegram_batch(deliveries: list[dict]) -> int:
+    if not settings.TELEGRAM_BOT_TOKEN:
+        logger.warning("TELEGRAM_BOT_TOKEN is not set, skipping %s Telegram notifications", len(deliveries))
+        return 0
+
+    with bot_client() as client:
+        return sum(_send_telegram_message(client, delivery) for delivery in deliveries)
+
+
+def send_websocket_batch(deliveries: list[dict]) -> int:
+    channel_layer = get_channel_layer()
+    for delivery in deliveries:
+        async_to_sync(channel_layer.group_send)(
+            user_group_name(delivery["address"]),
+            {"type": "user.notification", "subject": delivery["subject"], "body": delivery["body"]},
+        )
+    return len(deliveries)
+
+
+SENDERS = {
+    EMAIL: send_email_batch,
+    TELEGRAM: send_telegram_batch,
+    WEBSOCKET: send_websocket_batch,
+}
+
+
+def deliver(channel: str, deliveries: list[dict]) -> int:
+    return SENDERS[channel](deliveries)
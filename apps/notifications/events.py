@@ -0,0 +1,64 @@
+import json
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django_redis import get_redis_connection
+
+from .tasks import flush_family_events
+
+EVENTS_KEY = "household:family_events:{family_id}"
+FLUSH_LOCK_KEY = "household:family_events:{family_id}:flush"
+
+
+def family_group_name(family_id) -> str:
+    return f"family_{family_id}"
+
+
+def user_group_name(user_id) -> str:
+    return f"user_{user_id}"
+
+
+def publish_family_event(family_id, event_type: str, payload: dict) -> None:
+    event = json.dumps({"type": event_type, "payload": payload}, cls=DjangoJSONEncoder)
+    transaction.on_commit(lambda: _enqueue(family_id, event), robust=True)
+
+
+def _enqueue(family_id, event: str) -> None:
+    window_ms = settings.FAMILY_EVENTS_BATCH_WINDOW_MS
+    redis = get_redis_connection("default")
+
+    pipe = redis.pipeline()
+    pipe.rpush(EVENTS_KEY.format(family_id=family_id), event)
+    pipe.set(FLUSH_LOCK_KEY.format(family_id=family_id), 1, nx=True, px=window_ms * 20)
+    _, scheduled = pipe.execute()
+
+    if scheduled:
+        flush_family_events.apply_async((str(family_id),), countdown=window_ms / 1000)
+
+
+def drain_family_events(family_id) -> int:
+    events_key = EVENTS_KEY.format(family_id=family_id)
+    redis = get_redis_connection("default")
+
+    pipe = redis.pipeline()
+    pipe.delete(FLUSH_LOCK_KEY.format(family_id=family_id))
+    pipe.lrange(events_key, 0, settings.FAMILY_EVENTS_MAX_BATCH - 1)
+    pipe.llen(events_key)
+    pipe.delete(events_key)
+    _, raw_events, total, _ = pipe.execute()
+
+    if not raw_events:
+        return 0
+
+    async_to_sync(get_channel_layer().group_send)(
+        family_group_name(family_id),
+        {
+            "type": "family.events",
+            "events": [json.loads(raw) for raw in raw_events],
+            "dropped": total - len(raw_events),
+        },
+    )
+    return total
@@ -1,4 +1,8 @@
 from django.urls import path
 
+from .consumers import FamilyEventsConsumer, UserNotificationsConsumer
+
 websocket_urlpatterns = [
+    path("ws/families/<uuid:family_id>/", FamilyEventsConsumer.as_asgi()),
+    path("ws/notifications/", UserNotificationsConsumer.as_asgi()),
 ]
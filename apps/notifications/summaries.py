@@ -0,0 +1,64 @@
+from collections import defaultdict
+from decimal import Decimal
+from itertools import islice
+
+from django.utils import timezone
+
+from apps.budgets.counters import get_current_spend
+from apps.budgets.models import Budget
+from apps.families.models import FamilyMember
+
+from .dispatch import EMAIL, TELEGRAM, Notification, dispatch_notifications
+
+SUMMARY_CHUNK_SIZE = 500
+
+
+def _budget_line(budget, spent, currency) -> str:
+    percent = spent * 100 / budget.amount
+    return f"{budget.name}: {spent:.2f} / {budget.amount:.2f} {currency} ({percent:.0f}%)"
+
+
+def build_budget_summaries(day=None) -> dict:
+    day = day or timezone.localdate()
+    budgets = Budget.objects.filter(is_active=True).select_related("family").order_by("family_id", "name")
+
+    summaries = defaultdict(list)
+    iterator = budgets.iterator(chunk_size=SUMMARY_CHUNK_SIZE)
+    while chunk := list(islice(iterator, SUMMARY_CHUNK_SIZE)):
+        spend = get_current_spend(chunk, day)
+        for budget in chunk:
+            _, _, spent = spend[budget.id]
+            summaries[budget.family_id].append(_budget_line(budget, spent, budget.family.currency))
+    return summaries
+
+
+def _family_members(family_ids):
+    return FamilyMember.objects.filter(family_id__in=family_ids, is_active=True).values_list(
+        "family_id", "family__name", "user_id"
+    )
+
+
+def send_budget_summaries(day=None) -> int:
+    summaries = build_budget_summaries(day)
+    if not summaries:
+        return 0
+
+    notifications = [
+        Notification(user_id=user_id, subject=f"Budget summary: {family_name}", body="\n".join(summaries[family_id]))
+        for family_id, family_name, user_id in _family_members(summaries).iterator()
+    ]
+    return dispatch_notifications(notifications)
+
+
+def send_threshold_alert(budget_id, threshold: int, spent) -> int:
+    budget = Budget.objects.select_related("family").filter(id=budget_id, is_active=True).first()
+    if budget is None:
+        return 0
+
+    subject = f"{budget.family.name}: {budget.name} reached {threshold}%"
+    body = _budget_line(budget, Decimal(spent), budget.family.currency)
+    notifications = [
+        Notification(user_id=user_id, subject=subject, body=body, channels=(EMAIL, TELEGRAM))
+        for _, _, user_id in _family_members([budget.family_id])
+    ]
+    return dispatch_notifications(notifications, window=0)
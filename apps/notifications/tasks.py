@@ -0,0 +1,40 @@
+import logging
+
+from celery import shared_task
+
+from household_manager.db_router import use_replica
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def flush_family_events(family_id):
+    from .events import drain_family_events
+
+    return drain_family_events(family_id)
+
+
+@shared_task(ignore_result=True)
+def deliver_notifications(channel, deliveries):
+    from .dispatch import deliver
+
+    sent = deliver(channel, deliveries)
+    logger.info("Delivered %s of %s %s notifications", sent, len(deliveries), channel)
+    return sent
+
+
+@shared_task(ignore_result=True)
+@use_replica
+def send_daily_budget_summary():
+    from .summaries import send_budget_summaries
+
+    queued = send_budget_summaries()
+    logger.info("Queued %s budget summary notifications", queued)
+    return queued
+
+
+@shared_task(ignore_result=True)
+def send_budget_threshold_alert(budget_id, threshold, spent):
+    from .summaries import send_threshold_alert
+
+    return send_threshold_alert(budget_id, threshold, spent)
@@ -1 +1,30 @@
 from django.contrib import admin
+
+from .models import OcrResult, Receipt
+
+@admin.register(Receipt)
+class ReceiptAdmin(admin.ModelAdmin):
+
+    list_display = ["created_at", "family", "uploaded_by", "status", "is_duplicate", "merchant", "total"]
+    list_filter = ["status", "is_duplicate", "created_at"]
+    search_fields = ["merchant", "family__name", "uploaded_by__email"]
+    raw_id_fields = ["family", "uploaded_by", "ocr_result"]
+    list_select_related = ["family", "uploaded_by"]
+    readonly_fields = ["created_at", "updated_at", "processed_at", "timings", "raw_text"]
+    date_hierarchy = "created_at"
+
+    fieldsets = (
+        (None, {"fields": ("family", "uploaded_by", "image", "status", "error")}),
+        ("Deduplication", {"fields": ("sha256", "phash", "ocr_result", "is_duplicate")}),
+        ("Parsed", {"fields": ("merchant", "total", "purchased_at", "items", "raw_text")}),
+        ("Timings", {"fields": ("timings", "created_at", "updated_at", "processed_at")}),
+    )
+
+@admin.register(OcrResult)
+class OcrResultAdmin(admin.ModelAdmin):
+
+    list_display = ["created_at", "family", "sha256", "merchant", "total", "hits"]
+    search_fields = ["sha256", "merchant", "family__name"]
+    raw_id_fields = ["family"]
+    list_select_related = ["family"]
+    readonly_fields = ["created_at", "hits"]
@@ -1,7 +1,68 @@
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
 from ninja import Router
+from ninja.errors import HttpError
+
+from apps.families.models import FamilyPermission
+from apps.families.permissions import require_family_permission
+from apps.users.api import auth
+from household_manager.db_router import pin_to_primary, use_replica
+
+from .models import Receipt
+from .schemas import ReceiptResponseSchema
+from .services import create_receipt
+from .uploads import ReceiptUploadHandler
+
 router = Router()
 
-@router.get("/")
-def list_receipts(request):
+UPLOAD_REQUEST_BODY = {
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"image": {"type": "string", "format": "binary"}},
+                "required": ["image"],
+            }
+        }
+    }
+}
+
+
+@router.get("/family/{family_id}", response=list[ReceiptResponseSchema], auth=auth)
+@require_family_permission()
+@use_replica
+def list_receipts(request, family_id: UUID):
+    receipts = Receipt.objects.filter(family_id=family_id).defer("raw_text")[:100]
+    return list(receipts)
+
+
+@router.post(
+    "/family/{family_id}",
+    response={200: ReceiptResponseSchema, 202: ReceiptResponseSchema},
+    auth=auth,
+    openapi_extra={"requestBody": UPLOAD_REQUEST_BODY},
+)
+@require_family_permission(FamilyPermission.ADD, "You don't have permission to upload receipts")
+def upload_receipt(request, family_id: UUID):
+    handler = ReceiptUploadHandler(request)
+    request.upload_handlers = [handler]
+
+    image = request.FILES.get("image")
+    if handler.too_large:
+        raise HttpError(413, "Receipt image is too large")
+    if image is None:
+        raise HttpError(400, "Receipt image is required")
+
+    try:
+        receipt = create_receipt(family_id, request.auth.id, image)
+    except ValueError as exc:
+        raise HttpError(400, str(exc))
+    pin_to_primary(request.auth.id)
+    return (200 if receipt.is_duplicate else 202), receipt
+
 
-    return {"message": "Receipts API - coming soon"}
+@router.get("/family/{family_id}/{receipt_id}", response=ReceiptResponseSchema, auth=auth)
+@require_family_permission()
+def get_receipt(request, family_id: UUID, receipt_id: UUID):
+    return get_object_or_404(Receipt, id=receipt_id, family_id=family_id)
@@ -0,0 +1,39 @@
+import hashlib
+
+import cv2
+import numpy as np
+
+HASH_SIZE = 8
+BAND_BITS = 16
+BANDS = 64 // BAND_BITS
+
+
+def sha256_of(chunks) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dhash(image: np.ndarray) -> int:
+    small = cv2.resize(image, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def to_signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def bands(value: int) -> list[int]:
+    value = to_unsigned(value)
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (BAND_BITS * index)) & mask for index in range(BANDS)]
+
+
+def hamming(first: int, second: int) -> int:
+    return (to_unsigned(first) ^ to_unsigned(second)).bit_count()
@@ -0,0 +1,39 @@
+import cv2
+import numpy as np
+
+THUMBNAIL_WIDTH = 320
+WORKING_COPY_QUALITY = 85
+THUMBNAIL_QUALITY = 70
+
+
+def decode_upload(upload) -> np.ndarray:
+    if hasattr(upload, "temporary_file_path"):
+        image = cv2.imread(upload.temporary_file_path(), cv2.IMREAD_COLOR)
+    else:
+        upload.seek(0)
+        image = cv2.imdecode(np.frombuffer(upload.read(), np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Unsupported or corrupted image")
+    return image
+
+
+def downscale(image: np.ndarray, max_width: int) -> np.ndarray:
+    width = image.shape[1]
+    if width <= max_width:
+        return image
+    scale = max_width / width
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+def encode_jpeg(image: np.ndarray, quality: int) -> bytes:
+    ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+    if not ok:
+        raise ValueError("Could not encode image")
+    return buffer.tobytes()
+
+
+def render_copies(image: np.ndarray, max_width: int) -> tuple[np.ndarray, bytes, bytes]:
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    working = encode_jpeg(downscale(gray, max_width), WORKING_COPY_QUALITY)
+    thumbnail = encode_jpeg(downscale(image, THUMBNAIL_WIDTH), THUMBNAIL_QUALITY)
+    return gray, working, thumbnail
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:35
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('families', '0003_family_active_members_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Receipt',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('image', models.ImageField(blank=True, upload_to='receipts/', verbose_name='image')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='status')),
+                ('merchant', models.CharField(blank=True, max_length=150, verbose_name='merchant')),
+                ('total', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='total')),
+                ('purchased_at', models.DateField(blank=True, null=True, verbose_name='purchased at')),
+                ('items', models.JSONField(blank=True, default=list, verbose_name='line items')),
+                ('raw_text', models.TextField(blank=True, verbose_name='recognized text')),
+                ('timings', models.JSONField(blank=True, default=dict, verbose_name='stage timings, ms')),
+                ('error', models.TextField(blank=True, verbose_name='error')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='processed at')),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='families.family', verbose_name='family')),
+                ('uploaded_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='receipts', to=settings.AUTH_USER_MODEL, verbose_name='uploaded by')),
+            ],
+            options={
+                'verbose_name': 'receipt',
+                'verbose_name_plural': 'receipts',
+                'db_table': 'receipts',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['family', '-created_at'], name='idx_receipt_family_created')],
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('families', '0003_family_active_members_count'),
+        ('receipts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='receipt',
+            name='is_duplicate',
+            field=models.BooleanField(default=False, verbose_name='served from OCR cache'),
+        ),
+        migrations.AddField(
+            model_name='receipt',
+            name='phash',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='perceptual hash'),
+        ),
+        migrations.AddField(
+            model_name='receipt',
+            name='sha256',
+            field=models.CharField(blank=True, max_length=64, verbose_name='SHA-256'),
+        ),
+        migrations.CreateModel(
+            name='OcrResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('phash', models.BigIntegerField(verbose_name='perceptual hash')),
+                ('phash_band0', models.PositiveIntegerField()),
+                ('phash_band1', models.PositiveIntegerField()),
+                ('phash_band2', models.PositiveIntegerField()),
+                ('phash_band3', models.PositiveIntegerField()),
+                ('merchant', models.CharField(blank=True, max_length=150, verbose_name='merchant')),
+                ('total', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True, verbose_name='total')),
+                ('purchased_at', models.DateField(blank=True, null=True, verbose_name='purchased at')),
+                ('items', models.JSONField(blank=True, default=list, verbose_name='line items')),
+                ('raw_text', models.TextField(blank=True, verbose_name='recognized text')),
+                ('hits', models.PositiveIntegerField(default=0, verbose_name='cache hits')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('family', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ocr_results', to='families.family', verbose_name='family')),
+            ],
+            options={
+                'verbose_name': 'OCR result',
+                'verbose_name_plural': 'OCR results',
+                'db_table': 'receipt_ocr_results',
+            },
+        ),
+        migrations.AddField(
+            model_name='receipt',
+            name='ocr_result',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='receipts', to='receipts.ocrresult', verbose_name='OCR result'),
+        ),
+        migrations.AddIndex(
+            model_name='ocrresult',
+            index=models.Index(fields=['family', 'phash_band0'], name='idx_ocr_result_band0'),
+        ),
+        migrations.AddIndex(
+            model_name='ocrresult',
+            index=models.Index(fields=['family', 'phash_band1'], name='idx_ocr_result_band1'),
+        ),
+        migrations.AddIndex(
+            model_name='ocrresult',
+            index=models.Index(fields=['family', 'phash_band2'], name='idx_ocr_result_band2'),
+        ),
+        migrations.AddIndex(
+            model_name='ocrresult',
+            index=models.Index(fields=['family', 'phash_band3'], name='idx_ocr_result_band3'),
+        ),
+        migrations.AddConstraint(
+            model_name='ocrresult',
+            constraint=models.UniqueConstraint(fields=('family', 'sha256'), name='uniq_ocr_result_family_sha256'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('receipts', '0002_ocr_result_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='receipt',
+            name='thumbnail',
+            field=models.ImageField(blank=True, upload_to='receipts/%Y/%m/%d/', verbose_name='thumbnail'),
+        ),
+        migrations.AlterField(
+            model_name='receipt',
+            name='image',
+            field=models.ImageField(blank=True, upload_to='receipts/%Y/%m/%d/', verbose_name='image'),
+        ),
+    ]
@@ -1 +1,112 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.families.models import Family
+
+class ReceiptStatus(models.TextChoices):
+
+    PENDING = "pending", _("Pending")
+    PROCESSING = "processing", _("Processing")
+    DONE = "done", _("Done")
+    FAILED = "failed", _("Failed")
+
+class OcrResult(models.Model):
+
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="ocr_results",
+        verbose_name=_("family"),
+    )
+    sha256 = models.CharField(_("SHA-256"), max_length=64)
+    phash = models.BigIntegerField(_("perceptual hash"))
+    phash_band0 = models.PositiveIntegerField()
+    phash_band1 = models.PositiveIntegerField()
+    phash_band2 = models.PositiveIntegerField()
+    phash_band3 = models.PositiveIntegerField()
+    merchant = models.CharField(_("merchant"), max_length=150, blank=True)
+    total = models.DecimalField(_("total"), max_digits=12, decimal_places=2, null=True, blank=True)
+    purchased_at = models.DateField(_("purchased at"), null=True, blank=True)
+    items = models.JSONField(_("line items"), default=list, blank=True)
+    raw_text = models.TextField(_("recognized text"), blank=True)
+    hits = models.PositiveIntegerField(_("cache hits"), default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "receipt_ocr_results"
+        verbose_name = _("OCR result")
+        verbose_name_plural = _("OCR results")
+        constraints = [
+            models.UniqueConstraint(fields=["family", "sha256"], name="uniq_ocr_result_family_sha256"),
+        ]
+        indexes = [
+            models.Index(fields=["family", "phash_band0"], name="idx_ocr_result_band0"),
+            models.Index(fields=["family", "phash_band1"], name="idx_ocr_result_band1"),
+            models.Index(fields=["family", "phash_band2"], name="idx_ocr_result_band2"),
+            models.Index(fields=["family", "phash_band3"], name="idx_ocr_result_band3"),
+        ]
+
+    def __str__(self):
+        return f"OCR result {self.sha256[:12]}"
+
+class Receipt(models.Model):
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    family = models.ForeignKey(
+        Family,
+        on_delete=models.CASCADE,
+        related_name="receipts",
+        verbose_name=_("family"),
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="receipts",
+        verbose_name=_("uploaded by"),
+    )
+    image = models.ImageField(_("image"), upload_to="receipts/%Y/%m/%d/", blank=True)
+    thumbnail = models.ImageField(_("thumbnail"), upload_to="receipts/%Y/%m/%d/", blank=True)
+    sha256 = models.CharField(_("SHA-256"), max_length=64, blank=True)
+    phash = models.BigIntegerField(_("perceptual hash"), null=True, blank=True)
+    ocr_result = models.ForeignKey(
+        OcrResult,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="receipts",
+        verbose_name=_("OCR result"),
+    )
+    is_duplicate = models.BooleanField(_("served from OCR cache"), default=False)
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=ReceiptStatus.choices,
+        default=ReceiptStatus.PENDING,
+    )
+    merchant = models.CharField(_("merchant"), max_length=150, blank=True)
+    total = models.DecimalField(_("total"), max_digits=12, decimal_places=2, null=True, blank=True)
+    purchased_at = models.DateField(_("purchased at"), null=True, blank=True)
+    items = models.JSONField(_("line items"), default=list, blank=True)
+    raw_text = models.TextField(_("recognized text"), blank=True)
+    timings = models.JSONField(_("stage timings, ms"), default=dict, blank=True)
+    error = models.TextField(_("error"), blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    processed_at = models.DateTimeField(_("processed at"), null=True, blank=True)
+
+    class Meta:
+        db_table = "receipts"
+        verbose_name = _("receipt")
+        verbose_name_plural = _("receipts")
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["family", "-created_at"], name="idx_receipt_family_created"),
+        ]
+
+    def __str__(self):
+        return f"Receipt {self.id} ({self.status})"
@@ -0,0 +1,200 @@
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+import cv2
+import numpy as np
+import pytesseract
+from django.conf import settings
+
+from .images import downscale
+
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_CMD
+
+REGION_CONFIG = "--oem 1 --psm 6"
+MAX_SKEW_DEGREES = 15
+MIN_SKEW_DEGREES = 0.3
+MIN_LINE_HEIGHT = 6
+LINE_GAP = 3
+LINE_PADDING = 4
+
+AMOUNT_RE = re.compile(r"(?<![\d.,])(\d{1,7}(?:[  ]\d{3})*[.,]\d{2})\s*[=*]?\s*$")
+QUANTITY_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*[xх*]\s*(\d+[.,]\d{2})", re.IGNORECASE)
+TOTAL_RE = re.compile(r"^\s*(итого?|всего|к оплате|total|sum)\b", re.IGNORECASE)
+SKIP_RE = re.compile(r"(ндс|vat|сдача|change|наличн|безнал|карт|card|cash)", re.IGNORECASE)
+DATE_RE = re.compile(r"\b(\d{2})[./-](\d{2})[./-](\d{4}|\d{2})\b")
+
+
+@dataclass
+class ReceiptParse:
+    text: str
+    merchant: str
+    items: list[dict]
+    total: Optional[Decimal]
+    purchased_at: Optional[date]
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@contextmanager
+def timed(timings: dict, stage: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def decode(path) -> np.ndarray:
+    image = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        raise ValueError("Unsupported or corrupted image")
+    return image
+
+
+def deskew(image: np.ndarray) -> np.ndarray:
+    ink = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)[1]
+    points = cv2.findNonZero(ink)
+    if points is None:
+        return image
+
+    angle = cv2.minAreaRect(points)[-1]
+    if angle > 45:
+        angle -= 90
+    if not MIN_SKEW_DEGREES <= abs(angle) <= MAX_SKEW_DEGREES:
+        return image
+
+    height, width = image.shape
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    return cv2.warpAffine(image, matrix, (width, height), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
+
+
+def binarize(image: np.ndarray) -> np.ndarray:
+    blurred = cv2.GaussianBlur(image, (3, 3), 0)
+    return cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 15)
+
+
+def segment_lines(binary: np.ndarray) -> list[tuple[int, int]]:
+    ink_per_row = np.count_nonzero(binary == 0, axis=1)
+    has_ink = (ink_per_row > max(2, binary.shape[1] // 200)).astype(np.int8)
+
+    edges = np.diff(np.concatenate(([0], has_ink, [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    lines = []
+    for start, end in zip(starts, ends):
+        if lines and start - lines[-1][1] < LINE_GAP:
+            lines[-1] = (lines[-1][0], end)
+        else:
+            lines.append((start, end))
+    return [(start, end) for start, end in lines if end - start >= MIN_LINE_HEIGHT]
+
+
+def split_regions(binary: np.ndarray, lines: list[tuple[int, int]], lines_per_region: int) -> list[np.ndarray]:
+    if not lines:
+        return [binary]
+
+    height = binary.shape[0]
+    regions = []
+    for index in range(0, len(lines), lines_per_region):
+        group = lines[index:index + lines_per_region]
+        top = max(group[0][0] - LINE_PADDING, 0)
+        bottom = min(group[-1][1] + LINE_PADDING, height)
+        regions.append(binary[top:bottom])
+    return regions
+
+
+def _recognize_region(region: np.ndarray) -> str:
+    return pytesseract.image_to_string(region, lang=settings.TESSERACT_LANG, config=REGION_CONFIG)
+
+
+def recognize(regions: list[np.ndarray]) -> str:
+    workers = max(1, min(settings.OCR_MAX_WORKERS, len(regions)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return "\n".join(text.strip("\n") for text in pool.map(_recognize_region, regions))
+
+
+def _to_decimal(value: str) -> Optional[Decimal]:
+    try:
+        return Decimal(value.replace(" ", "").replace(" ", "").replace(",", "."))
+    except InvalidOperation:
+        return None
+
+
+def _to_date(match) -> Optional[date]:
+    day, month, year = (int(part) for part in match.groups())
+    if year < 100:
+        year += 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_text(text: str) -> dict:
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    items, total, purchased_at = [], None, None
+
+    for line in lines:
+        if purchased_at is None and (date_match := DATE_RE.search(line)):
+            purchased_at = _to_date(date_match)
+
+        amount_match = AMOUNT_RE.search(line)
+        if not amount_match:
+            continue
+        amount = _to_decimal(amount_match.group(1))
+        if amount is None:
+            continue
+
+        if TOTAL_RE.search(line):
+            total = total or amount
+            continue
+        if SKIP_RE.search(line):
+            continue
+
+        name = line[:amount_match.start()].strip(" .:=*")
+        quantity, price = Decimal(1), amount
+        if quantity_match := QUANTITY_RE.search(name):
+            quantity = _to_decimal(quantity_match.group(1)) or quantity
+            price = _to_decimal(quantity_match.group(2)) or price
+            name = name[:quantity_match.start()].strip(" .:=*")
+        if name:
+            items.append({"name": name[:255], "quantity": str(quantity), "price": str(price), "amount": str(amount)})
+
+    if total is None and items:
+        total = sum(Decimal(item["amount"]) for item in items)
+
+    return {
+        "merchant": lines[0][:150] if lines else "",
+        "items": items,
+        "total": total,
+        "purchased_at": purchased_at,
+    }
+
+
+def preprocess(image: np.ndarray) -> np.ndarray:
+    return binarize(deskew(downscale(image, settings.OCR_MAX_WIDTH)))
+
+
+def run_pipeline(path) -> ReceiptParse:
+    timings = {}
+
+    with timed(timings, "decode"):
+        image = decode(path)
+    with timed(timings, "preprocess"):
+        binary = preprocess(image)
+    with timed(timings, "segment"):
+        regions = split_regions(binary, segment_lines(binary), settings.OCR_LINES_PER_REGION)
+    with timed(timings, "recognize"):
+        text = recognize(regions)
+    with timed(timings, "parse"):
+        parsed = parse_text(text)
+
+    timings["regions"] = len(regions)
+    return ReceiptParse(text=text, timings=timings, **parsed)
@@ -0,0 +1,31 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ninja import Schema
+
+class ReceiptItemSchema(Schema):
+
+    name: str
+    quantity: Decimal
+    price: Decimal
+    amount: Decimal
+
+class ReceiptResponseSchema(Schema):
+
+    id: UUID
+    family_id: UUID
+    uploaded_by_id: Optional[UUID]
+    status: str
+    thumbnail: Optional[str]
+    sha256: str
+    is_duplicate: bool
+    merchant: str
+    total: Optional[Decimal]
+    purchased_at: Optional[date]
+    items: List[ReceiptItemSchema]
+    timings: Dict[str, float]
+    error: str
+    created_at: datetime
+    processed_at: Optional[datetime]
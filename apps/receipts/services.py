@@ -0,0 +1,75 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .fingerprint import bands, dhash, hamming, sha256_of, to_signed
+from .images import decode_upload, render_copies
+from .models import OcrResult, Receipt, ReceiptStatus
+from .tasks import process_receipt
+
+PARSE_FIELDS = ("merchant", "total", "purchased_at", "items", "raw_text")
+
+
+def find_ocr_result(family_id, sha256: str, phash: Optional[int]) -> Optional[OcrResult]:
+    exact = OcrResult.objects.filter(family_id=family_id, sha256=sha256).first()
+    if exact is not None or phash is None:
+        return exact
+
+    condition = Q()
+    for index, band in enumerate(bands(phash)):
+        condition |= Q(**{f"phash_band{index}": band})
+
+    candidates = OcrResult.objects.filter(condition, family_id=family_id)
+    best = min(candidates, key=lambda candidate: hamming(candidate.phash, phash), default=None)
+    if best is not None and hamming(best.phash, phash) <= settings.OCR_PHASH_MAX_DISTANCE:
+        return best
+    return None
+
+
+def apply_ocr_result(receipt: Receipt, result: OcrResult) -> None:
+    for field in PARSE_FIELDS:
+        setattr(receipt, field, getattr(result, field))
+    receipt.ocr_result = result
+    receipt.is_duplicate = True
+    receipt.status = ReceiptStatus.DONE
+    receipt.processed_at = timezone.now()
+    OcrResult.objects.filter(id=result.id).update(hits=F("hits") + 1)
+
+
+def store_ocr_result(receipt: Receipt) -> Optional[OcrResult]:
+    if not receipt.sha256 or receipt.phash is None:
+        return None
+
+    result, _ = OcrResult.objects.get_or_create(
+        family_id=receipt.family_id,
+        sha256=receipt.sha256,
+        defaults={
+            "phash": receipt.phash,
+            **{f"phash_band{index}": band for index, band in enumerate(bands(receipt.phash))},
+            **{field: getattr(receipt, field) for field in PARSE_FIELDS},
+        },
+    )
+    return result
+
+
+def create_receipt(family_id, user_id, upload) -> Receipt:
+    sha256 = getattr(upload, "sha256", None) or sha256_of(upload.chunks())
+    gray, working, thumbnail = render_copies(decode_upload(upload), settings.OCR_MAX_WIDTH)
+    phash = to_signed(dhash(gray))
+    result = find_ocr_result(family_id, sha256, phash)
+
+    receipt = Receipt(family_id=family_id, uploaded_by_id=user_id, sha256=sha256, phash=phash)
+    receipt.image.save(f"{receipt.id}.jpg", ContentFile(working), save=False)
+    receipt.thumbnail.save(f"{receipt.id}_thumb.jpg", ContentFile(thumbnail), save=False)
+    with transaction.atomic():
+        if result is not None:
+            apply_ocr_result(receipt, result)
+        receipt.save()
+
+    if result is None:
+        transaction.on_commit(lambda: process_receipt.delay(str(receipt.id)))
+    return receipt
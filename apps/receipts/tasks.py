@@ -0,0 +1,97 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def process_receipt(receipt_id):
+    from datetime import timedelta
+
+    from django.conf import settings
+    from django.db.models import Q
+    from django.utils import timezone
+
+    from .models import Receipt, ReceiptStatus
+    from .ocr import run_pipeline
+    from .services import apply_ocr_result, find_ocr_result, store_ocr_result
+
+    now = timezone.now()
+    claimable = Q(status__in=[ReceiptStatus.PENDING, ReceiptStatus.FAILED]) | Q(
+        status=ReceiptStatus.PROCESSING,
+        updated_at__lt=now - timedelta(seconds=settings.OCR_CLAIM_TIMEOUT),
+    )
+    claimed = (
+        Receipt.objects.filter(claimable, id=receipt_id)
+        .update(status=ReceiptStatus.PROCESSING, error="", updated_at=now)
+    )
+    if not claimed:
+        return
+
+    receipt = Receipt.objects.get(id=receipt_id)
+    if receipt.sha256 and (result := find_ocr_result(receipt.family_id, receipt.sha256, receipt.phash)):
+        apply_ocr_result(receipt, result)
+        receipt.save()
+        return
+
+    try:
+        parsed = run_pipeline(receipt.image.path)
+    except Exception as exc:
+        logger.exception("OCR failed for receipt %s", receipt_id)
+        receipt.status = ReceiptStatus.FAILED
+        receipt.error = str(exc)
+        receipt.save(update_fields=["status", "error", "updated_at"])
+        return
+
+    receipt.status = ReceiptStatus.DONE
+    receipt.raw_text = parsed.text
+    receipt.merchant = parsed.merchant
+    receipt.items = parsed.items
+    receipt.total = parsed.total
+    receipt.purchased_at = parsed.purchased_at
+    receipt.timings = parsed.timings
+    receipt.processed_at = timezone.now()
+    receipt.ocr_result = store_ocr_result(receipt)
+    receipt.save()
+
+    logger.info("Receipt %s processed: %s", receipt_id, parsed.timings)
+
+
+@shared_task(ignore_result=True)
+def cleanup_old_receipt_images():
+    import shutil
+    from datetime import date, datetime, time, timedelta
+
+    from django.conf import settings
+    from django.core.files.storage import default_storage
+    from django.utils import timezone
+
+    from .models import Receipt
+
+    cutoff = timezone.localdate() - timedelta(days=settings.RECEIPTS_RETENTION_DAYS)
+    removed = []
+
+    for year in _numeric_dirs(default_storage, "receipts"):
+        for month in _numeric_dirs(default_storage, f"receipts/{year}"):
+            for day in _numeric_dirs(default_storage, f"receipts/{year}/{month}"):
+                try:
+                    partition = date(int(year), int(month), int(day))
+                except ValueError:
+                    continue
+                if partition < cutoff:
+                    shutil.rmtree(default_storage.path(f"receipts/{year}/{month}/{day}"))
+                    removed.append(partition)
+
+    cutoff_at = timezone.make_aware(datetime.combine(cutoff, time.min))
+    Receipt.objects.filter(created_at__lt=cutoff_at).exclude(image="", thumbnail="").update(image="", thumbnail="")
+
+    logger.info("Removed %s receipt partitions older than %s", len(removed), cutoff)
+    return len(removed)
+
+
+def _numeric_dirs(storage, path):
+    if not storage.exists(path):
+        return []
+    directories, _ = storage.listdir(path)
+    return sorted(directory for directory in directories if directory.isdigit())
@@ -1,7 +1,25 @@
-from ninja import Router
+from hmac import compare_digest
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from ninja import Header, Router
+from ninja.errors import HttpError
+
+from .schemas import TelegramUpdateSchema
+from .updates import accept_update
+
 router = Router()
 
+
 @router.post("/webhook")
-def telegram_webhook(request):
+async def telegram_webhook(
+    request,
+    payload: TelegramUpdateSchema,
+    x_telegram_bot_api_secret_token: str = Header(default="", alias="X-Telegram-Bot-Api-Secret-Token"),
+):
+    secret = settings.TELEGRAM_WEBHOOK_SECRET
+    if not secret or not compare_digest(x_telegram_bot_api_secret_token.encode(), secret.encode()):
+        raise HttpError(403, "Invalid secret token")
 
-    return {"message": "Telegram webhook - coming soon"}
+    accepted = await sync_to_async(accept_update, thread_sensitive=False)(payload.model_dump())
+    return {"ok": True, "duplicate": not accepted}
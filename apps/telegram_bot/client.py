@@ -0,0 +1,19 @@
+import httpx
+from django.conf import settings
+
+
+def bot_client() -> httpx.Client:
+    return httpx.Client(
+        base_url=f"{settings.TELEGRAM_API_URL}/bot{settings.TELEGRAM_BOT_TOKEN}",
+        timeout=settings.TELEGRAM_REQUEST_TIMEOUT,
+    )
+
+
+def download_file(client: httpx.Client, file_id: str) -> bytes:
+    response = client.get("/getFile", params={"file_id": file_id})
+    response.raise_for_status()
+    file_path = response.json()["result"]["file_path"]
+
+    download = client.get(f"{settings.TELEGRAM_API_URL}/file/bot{settings.TELEGRAM_BOT_TOKEN}/{file_path}")
+    download.raise_for_status()
+    return download.content
@@ -0,0 +1,117 @@
+import logging
+import re
+from datetime import datetime, timezone
+
+import httpx
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from pydantic import ValidationError
+
+from apps.expenses.models import ExpenseSource
+from apps.expenses.schemas import ExpenseCreateSchema
+from apps.expenses.services import create_expenses
+from apps.families.models import ROLE_PERMISSIONS, FamilyMember, FamilyPermission
+from apps.notifications.dispatch import acquire_telegram_token
+from apps.receipts.services import create_receipt
+from apps.users.models import User
+
+from .client import bot_client, download_file
+
+logger = logging.getLogger(__name__)
+
+EXPENSE_RE = re.compile(r"^(\d+(?:[.,]\d{1,2})?)\s*(.*)$", re.S)
+
+HELP_TEXT = (
+    "Send an expense as \"<amount> <description>\", e.g. \"250 coffee\", "
+    "or send a photo of a receipt.\n/family shows the family your expenses go to."
+)
+LINK_TEXT = "This Telegram account is not linked yet. Link Telegram ID {telegram_id} in your profile settings."
+NO_FAMILY_TEXT = "You are not a member of a family you can add expenses to."
+INVALID_AMOUNT_TEXT = "The amount must be greater than zero and below 10,000,000,000."
+
+
+def _reply(client: httpx.Client, chat_id, text: str) -> None:
+    acquire_telegram_token()
+    try:
+        client.post("/sendMessage", json={"chat_id": chat_id, "text": text})
+    except httpx.HTTPError:
+        logger.exception("Could not reply to Telegram chat %s", chat_id)
+
+
+def _expense_family(user_id):
+    roles = [role for role, permissions in ROLE_PERMISSIONS.items() if FamilyPermission.ADD in permissions]
+    return (
+        FamilyMember.objects.filter(user_id=user_id, is_active=True, role__in=roles)
+        .select_related("family")
+        .order_by("joined_at")
+        .first()
+    )
+
+
+def _add_expense(client, chat_id, member, user_id, match, sent_at) -> None:
+    try:
+        item = ExpenseCreateSchema(
+            amount=match[1].replace(",", "."),
+            spent_at=sent_at,
+            description=match[2].strip()[:255],
+        )
+    except ValidationError:
+        _reply(client, chat_id, INVALID_AMOUNT_TEXT)
+        return
+
+    [expense] = create_expenses(member.family_id, user_id, [item.model_dump()], ExpenseSource.TELEGRAM)
+    _reply(client, chat_id, f"Added {expense.amount:.2f} {expense.currency} to {member.family.name}")
+
+
+def _add_receipt(client, chat_id, member, user_id, photos) -> None:
+    photo = max(photos, key=lambda size: size.get("file_size", 0))
+    if photo.get("file_size", 0) > settings.RECEIPTS_MAX_UPLOAD_SIZE:
+        _reply(client, chat_id, "The photo is too large")
+        return
+
+    try:
+        content = download_file(client, photo["file_id"])
+        receipt = create_receipt(
+            member.family_id,
+            user_id,
+            SimpleUploadedFile(f"{photo['file_unique_id']}.jpg", content, content_type="image/jpeg"),
+        )
+    except httpx.HTTPError:
+        logger.exception("Could not download Telegram file %s", photo["file_id"])
+        _reply(client, chat_id, "Could not download the photo, please try again")
+        return
+    except ValueError:
+        _reply(client, chat_id, "Could not read the photo as an image")
+        return
+
+    if receipt.is_duplicate:
+        _reply(client, chat_id, f"This receipt was already processed: {receipt.merchant} {receipt.total}")
+    else:
+        _reply(client, chat_id, f"Receipt received, processing it for {member.family.name}")
+
+
+def handle_update(update: dict) -> None:
+    message = update.get("message")
+    if not message or "from" not in message:
+        return
+
+    chat_id = message["chat"]["id"]
+    text = (message.get("text") or "").strip()
+    with bot_client() as client:
+        user = User.objects.filter(telegram_id=message["from"]["id"], is_active=True).only("id").first()
+        if user is None:
+            _reply(client, chat_id, LINK_TEXT.format(telegram_id=message["from"]["id"]))
+            return
+
+        member = _expense_family(user.id)
+        if member is None:
+            _reply(client, chat_id, NO_FAMILY_TEXT)
+        elif text == "/family":
+            _reply(client, chat_id, f"Expenses go to {member.family.name}")
+        elif message.get("photo"):
+            _add_receipt(client, chat_id, member, user.id, message["photo"])
+        elif match := EXPENSE_RE.match(text):
+            sent_at = datetime.fromtimestamp(message["date"], tz=timezone.utc)
+            _add_expense(client, chat_id, member, user.id, match, sent_at)
+        else:
+            _reply(client, chat_id, HELP_TEXT)
@@ -0,0 +1,29 @@
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.telegram_bot.client import bot_client
+
+
+class Command(BaseCommand):
+    help = "Register TELEGRAM_WEBHOOK_URL with Telegram together with the webhook secret token."
+
+    def handle(self, *args, **options):
+        if not (settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_WEBHOOK_URL and settings.TELEGRAM_WEBHOOK_SECRET):
+            raise CommandError("TELEGRAM_BOT_TOKEN, TELEGRAM_WEBHOOK_URL and TELEGRAM_WEBHOOK_SECRET must be set")
+
+        with bot_client() as client:
+            try:
+                response = client.post(
+                    "/setWebhook",
+                    json={
+                        "url": settings.TELEGRAM_WEBHOOK_URL,
+                        "secret_token": settings.TELEGRAM_WEBHOOK_SECRET,
+                        "allowed_updates": ["message"],
+                    },
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                raise CommandError(f"setWebhook failed: {exc}")
+
+        self.stdout.write(response.json().get("description", "Webhook registered"))
@@ -0,0 +1,8 @@
+from typing import Any, Dict, Optional
+
+from ninja import Schema
+
+class TelegramUpdateSchema(Schema):
+
+    update_id: int
+    message: Optional[Dict[str, Any]] = None
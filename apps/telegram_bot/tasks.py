@@ -0,0 +1,12 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def process_telegram_update(update):
+    from .handlers import handle_update
+
+    handle_update(update)
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from .tasks import process_telegram_update
+
+UPDATE_KEY = "household:telegram_update:{update_id}"
+
+
+def accept_update(update: dict) -> bool:
+    redis = get_redis_connection("default")
+    key = UPDATE_KEY.format(update_id=update["update_id"])
+    if not redis.set(key, 1, nx=True, ex=settings.TELEGRAM_UPDATE_DEDUP_TTL):
+        return False
+
+    try:
+        process_telegram_update.delay(update)
+    except Exception:
+        redis.delete(key)
+        raise
+    return True
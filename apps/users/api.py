@@ -6,7 +6,12 @@ from ninja.security import HttpBearer
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
+from apps.families.models import FamilyMember
+from apps.families.versions import bump_data_version
+from household_manager.transactions import atomic_route
+
 from .models import User
+from .principal import aget_principal, get_principal, invalidate_principal
 from .schemas import (
     LoginSchema,
     PasswordChangeSchema,
@@ -25,12 +30,22 @@ class AuthBearer(HttpBearer):
     def authenticate(self, request, token):
         try:
             access_token = AccessToken(token)
-            return User.objects.get(id=access_token["user_id"])
-        except (TokenError, User.DoesNotExist, ValueError, KeyError):
+            return get_principal(access_token["user_id"])
+        except (TokenError, ValueError, KeyError):
+            return None
+
+
+class AsyncAuthBearer(HttpBearer):
+    async def authenticate(self, request, token):
+        try:
+            access_token = AccessToken(token)
+            return await aget_principal(access_token["user_id"])
+        except (TokenError, ValueError, KeyError):
             return None
 
 
 auth = AuthBearer()
+async_auth = AsyncAuthBearer()
 
 
 def get_tokens_for_user(user):
@@ -74,38 +89,49 @@ def refresh_token(request, payload: RefreshTokenSchema):
         raise HttpError(401, "Invalid refresh token")
 
 
-@router.get("/me", response=UserResponseSchema, auth=auth, tags=["Users"])
-def get_current_user(request):
+@router.get("/me", response=UserResponseSchema, auth=async_auth, tags=["Users"])
+async def get_current_user(request):
     return request.auth
 
 
 @router.patch("/me", response=UserResponseSchema, auth=auth, tags=["Users"])
+@atomic_route()
 def update_current_user(request, payload: UserUpdateSchema):
-    user = request.auth
+    user = request.auth.user
 
-    for attr, value in payload.model_dump(exclude_unset=True).items():
+    changes = payload.model_dump(exclude_unset=True)
+    for attr, value in changes.items():
         setattr(user, attr, value)
 
     user.save()
+    invalidate_principal(user.id)
+    if {"first_name", "last_name"} & changes.keys():
+        for family_id in FamilyMember.objects.filter(user_id=user.id, is_active=True).values_list(
+            "family_id", flat=True
+        ):
+            bump_data_version(family_id)
     return user
 
 
 @router.post("/me/change-password", auth=auth, tags=["Users"])
+@atomic_route()
 def change_password(request, payload: PasswordChangeSchema):
-    user = request.auth
+    user = request.auth.user
 
     if not user.check_password(payload.old_password):
         raise HttpError(400, "Invalid old password")
 
     user.set_password(payload.new_password)
     user.save()
+    invalidate_principal(user.id)
 
     return {"detail": "Password changed successfully"}
 
 
 @router.post("/me/link-telegram", auth=auth, tags=["Users"])
+@atomic_route()
 def link_telegram(request, payload: TelegramLinkSchema):
-    user = request.auth
+    user = request.auth.user
 
     if User.objects.filter(telegram_id=payload.telegram_id).exclude(id=user.id).exists():
         raise HttpError(400, "This Telegram account is already linked to another user")
@@ -113,15 +139,18 @@ def link_telegram(request, payload: TelegramLinkSchema):
     user.telegram_id = payload.telegram_id
     user.telegram_username = payload.telegram_username
     user.save()
+    invalidate_principal(user.id)
 
     return {"detail": "Telegram account linked successfully"}
 
 
 @router.delete("/me/unlink-telegram", auth=auth, tags=["Users"])
+@atomic_route()
 def unlink_telegram(request):
-    user = request.auth
+    user = request.auth.user
     user.telegram_id = None
     user.telegram_username = None
     user.save()
+    invalidate_principal(user.id)
 
     return {"detail": "Telegram account unlinked successfully"}
@@ -0,0 +1,47 @@
+from typing import Optional
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .principal import UserPrincipal, get_principal
+
+TOKEN_SUBPROTOCOL = "bearer"
+TOKEN_QUERY_PARAM = "token"
+
+
+def _get_token(scope) -> tuple[Optional[str], Optional[str]]:
+    subprotocols = scope.get("subprotocols") or []
+    if TOKEN_SUBPROTOCOL in subprotocols:
+        index = subprotocols.index(TOKEN_SUBPROTOCOL)
+        if index + 1 < len(subprotocols):
+            return subprotocols[index + 1], TOKEN_SUBPROTOCOL
+
+    query = parse_qs(scope.get("query_string", b"").decode())
+    tokens = query.get(TOKEN_QUERY_PARAM)
+    return (tokens[0], None) if tokens else (None, None)
+
+
+def _authenticate(token: str) -> Optional[UserPrincipal]:
+    try:
+        user_id = AccessToken(token)["user_id"]
+    except (TokenError, KeyError):
+        return None
+    return get_principal(user_id)
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    async def __call__(self, scope, receive, send):
+        token, subprotocol = _get_token(scope)
+        principal = await database_sync_to_async(_authenticate)(token) if token else None
+
+        scope = dict(
+            scope,
+            user=principal or AnonymousUser(),
+            auth_subprotocol=subprotocol if principal else None,
+            memberships={},
+        )
+        return await super().__call__(scope, receive, send)
@@ -0,0 +1,93 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from functools import cached_property
+from typing import Optional
+from uuid import UUID
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from household_manager.cache import LocalTTLCache
+
+from .models import User
+
+PRINCIPAL_CACHE_KEY = "auth:principal:{user_id}"
+
+_local_principals = LocalTTLCache(
+    maxsize=settings.AUTH_PRINCIPAL_LOCAL_MAXSIZE,
+    ttl=settings.AUTH_PRINCIPAL_LOCAL_TTL,
+)
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    id: UUID
+    email: str
+    first_name: str
+    last_name: str
+    phone: Optional[str]
+    avatar: Optional[str]
+    telegram_id: Optional[int]
+    telegram_username: Optional[str]
+    telegram_notifications_enabled: bool
+    email_notifications_enabled: bool
+    currency: str
+    language: str
+    is_staff: bool
+    created_at: datetime
+    updated_at: datetime
+
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+
+    @property
+    def pk(self) -> UUID:
+        return self.id
+
+    def get_full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+    @cached_property
+    def user(self) -> User:
+        return User.objects.get(id=self.id)
+
+
+PRINCIPAL_FIELDS = tuple(f.name for f in fields(UserPrincipal))
+
+
+def _cache_key(user_id) -> str:
+    return PRINCIPAL_CACHE_KEY.format(user_id=user_id)
+
+
+def get_principal(user_id) -> Optional[UserPrincipal]:
+    key = str(user_id)
+
+    data = _local_principals.get(key)
+    if data is None:
+        data = cache.get(_cache_key(key))
+        if data is None:
+            data = User.objects.filter(id=user_id, is_active=True).values(*PRINCIPAL_FIELDS).first()
+            if data is None:
+                return None
+            cache.set(_cache_key(key), data, settings.AUTH_PRINCIPAL_CACHE_TIMEOUT)
+        _local_principals.set(key, data)
+
+    return UserPrincipal(**data)
+
+
+async def aget_principal(user_id) -> Optional[UserPrincipal]:
+    data = _local_principals.get(str(user_id))
+    if data is not None:
+        return UserPrincipal(**data)
+    return await database_sync_to_async(get_principal)(user_id)
+
+
+def invalidate_principal(user_id) -> None:
+    def _invalidate():
+        _local_principals.delete(str(user_id))
+        cache.delete(_cache_key(user_id))
+
+    transaction.on_commit(_invalidate)
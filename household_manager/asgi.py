@@ -1,21 +1,25 @@
 import os
 
-from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.security.websocket import AllowedHostsOriginValidator
 from django.core.asgi import get_asgi_application
 
+from household_manager.metrics import register_db_pool_metrics
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "household_manager.settings")
 
 django_asgi_app = get_asgi_application()
 
 from apps.expenses.routing import websocket_urlpatterns as expense_ws_patterns
 from apps.notifications.routing import websocket_urlpatterns as notification_ws_patterns
+from apps.users.middleware import JWTAuthMiddleware
+
+register_db_pool_metrics()
 
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AllowedHostsOriginValidator(
-        AuthMiddlewareStack(
+        JWTAuthMiddleware(
             URLRouter(
                 expense_ws_patterns + notification_ws_patterns
             )
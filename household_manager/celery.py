@@ -3,6 +3,7 @@ from importlib import import_module
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "household_manager.settings")
 
@@ -18,6 +19,7 @@ _route_defs = {
     "apps.receipts.tasks": {"queue": "ocr"},
     "apps.ml_categorizer.tasks": {"queue": "ml"},
     "apps.notifications.tasks": {"queue": "notifications"},
+    "apps.telegram_bot.tasks": {"queue": "telegram"},
 }
 
 for module_path, route in _route_defs.items():
@@ -45,6 +47,15 @@ app.conf.task_routes = _task_routes
 app.conf.beat_schedule = _beat_schedule
 
 
+@worker_init.connect
+def close_db_pools(**kwargs):
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        if getattr(connection, "pool", None) is not None:
+            connection.close_pool()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
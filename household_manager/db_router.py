@@ -0,0 +1,84 @@
+import random
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest
+
+STICKY_KEY = "db:sticky:{user_id}"
+
+_read_alias: ContextVar[str] = ContextVar("read_alias", default=DEFAULT_DB_ALIAS)
+
+
+def read_alias() -> str:
+    return _read_alias.get()
+
+
+def pin_to_primary(user_id) -> None:
+    if settings.DATABASE_REPLICAS and user_id is not None:
+        cache.set(STICKY_KEY.format(user_id=user_id), 1, settings.DB_REPLICA_STICKY_SECONDS)
+
+
+def _request_user_id(args) -> Optional[str]:
+    if args and isinstance(args[0], HttpRequest):
+        return getattr(getattr(args[0], "auth", None), "id", None)
+    return None
+
+
+def _pick_replica(sticky: bool) -> str:
+    if sticky or not settings.DATABASE_REPLICAS:
+        return DEFAULT_DB_ALIAS
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+def use_replica(func):
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            user_id = _request_user_id(args)
+            sticky = bool(
+                settings.DATABASE_REPLICAS
+                and user_id is not None
+                and await cache.aget(STICKY_KEY.format(user_id=user_id))
+            )
+            token = _read_alias.set(_pick_replica(sticky))
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _read_alias.reset(token)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        user_id = _request_user_id(args)
+        sticky = bool(
+            settings.DATABASE_REPLICAS
+            and user_id is not None
+            and cache.get(STICKY_KEY.format(user_id=user_id))
+        )
+        token = _read_alias.set(_pick_replica(sticky))
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,46 @@
+from django.db import connections
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+POOL_GAUGES = {
+    "pool_size": ("django_db_pool_connections", "Connections currently managed by the pool"),
+    "pool_available": ("django_db_pool_available_connections", "Idle connections ready to be handed out"),
+    "pool_max": ("django_db_pool_max_connections", "Maximum size of the pool"),
+    "requests_waiting": ("django_db_pool_waiting_requests", "Requests currently waiting for a connection"),
+}
+POOL_COUNTERS = {
+    "requests_num": ("django_db_pool_requests", "Connections requested from the pool", 1),
+    "requests_errors": ("django_db_pool_request_errors", "Requests that timed out or were rejected", 1),
+    "requests_wait_ms": ("django_db_pool_wait_seconds", "Time spent waiting for a connection", 1000),
+    "connections_num": ("django_db_pool_connects", "Connections opened by the pool", 1),
+    "connections_lost": ("django_db_pool_connections_lost", "Connections found broken by health checks", 1),
+}
+
+
+class DatabasePoolCollector:
+    def collect(self):
+        gauges = {key: GaugeMetricFamily(name, doc, labels=["alias"]) for key, (name, doc) in POOL_GAUGES.items()}
+        counters = {
+            key: CounterMetricFamily(name, doc, labels=["alias"]) for key, (name, doc, _) in POOL_COUNTERS.items()
+        }
+
+        for alias in connections:
+            pool = getattr(connections[alias], "pool", None)
+            if pool is None:
+                continue
+
+            stats = pool.get_stats()
+            for key, metric in gauges.items():
+                metric.add_metric([alias], stats.get(key, 0))
+            for key, metric in counters.items():
+                metric.add_metric([alias], stats.get(key, 0) / POOL_COUNTERS[key][2])
+
+        yield from gauges.values()
+        yield from counters.values()
+
+
+def register_db_pool_metrics() -> None:
+    try:
+        REGISTRY.register(DatabasePoolCollector())
+    except ValueError:
+        pass
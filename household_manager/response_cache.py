@@ -0,0 +1,93 @@
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from ninja.decorators import decorate_view
+
+RESPONSE_KEY = "response:{digest}"
+CACHE_CONTROL = "private, no-cache"
+
+
+def _lookup(request, version, kwargs) -> tuple[str, bool, bytes | None]:
+    token = f"{version(request, **kwargs)}:{request.get_full_path()}"
+    digest = hashlib.md5(token.encode(), usedforsecurity=False).hexdigest()
+    request.response_cache_digest = digest
+
+    etag = f'"{digest}"'
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in if_none_match or "*" in if_none_match:
+        return etag, True, None
+    return etag, False, cache.get(RESPONSE_KEY.format(digest=digest))
+
+
+def _cached_response(etag: str, not_modified: bool, content: bytes | None) -> HttpResponse | None:
+    if not_modified:
+        response = HttpResponse(status=304)
+    elif content is not None:
+        response = HttpResponse(content, content_type="application/json; charset=utf-8")
+    else:
+        return None
+
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def _store(request, response) -> None:
+    digest = getattr(request, "response_cache_digest", None)
+    if digest is None or response.status_code == 304:
+        return
+
+    response["ETag"] = f'"{digest}"'
+    response["Cache-Control"] = CACHE_CONTROL
+    if response.status_code == 200 and not getattr(request, "response_cache_hit", False):
+        cache.set(RESPONSE_KEY.format(digest=digest), response.content, settings.RESPONSE_CACHE_TIMEOUT)
+
+
+def _store_response(run):
+    if iscoroutinefunction(run):
+        @wraps(run)
+        async def async_wrapper(request, *args, **kwargs):
+            response = await run(request, *args, **kwargs)
+            await sync_to_async(_store)(request, response)
+            return response
+
+        return async_wrapper
+
+    @wraps(run)
+    def wrapper(request, *args, **kwargs):
+        response = run(request, *args, **kwargs)
+        _store(request, response)
+        return response
+
+    return wrapper
+
+
+def cache_response(version):
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                response = _cached_response(*await sync_to_async(_lookup)(request, version, kwargs))
+                if response is not None:
+                    request.response_cache_hit = True
+                    return response
+                return await view_func(request, *args, **kwargs)
+
+            return decorate_view(_store_response)(async_wrapper)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = _cached_response(*_lookup(request, version, kwargs))
+            if response is not None:
+                request.response_cache_hit = True
+                return response
+            return view_func(request, *args, **kwargs)
+
+        return decorate_view(_store_response)(wrapper)
+
+    return decorator
@@ -86,6 +86,16 @@ TEMPLATES = [
 WSGI_APPLICATION = "household_manager.wsgi.application"
 ASGI_APPLICATION = "household_manager.asgi.application"
 
+PROCESS_TYPE = config("PROCESS_TYPE", default="web")
+
+DB_POOL_MIN_SIZE = config("DB_POOL_MIN_SIZE", default={"web": 2}.get(PROCESS_TYPE, 0), cast=int)
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", default={"web": 10, "worker": 2}.get(PROCESS_TYPE, 1), cast=int)
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=10, cast=float)
+DB_POOL_MAX_WAITING = config("DB_POOL_MAX_WAITING", default=0, cast=int)
+DB_POOL_MAX_IDLE = config("DB_POOL_MAX_IDLE", default={"web": 300}.get(PROCESS_TYPE, 60), cast=float)
+DB_POOL_MAX_LIFETIME = config("DB_POOL_MAX_LIFETIME", default=1800, cast=float)
+DB_HEALTH_CHECKS = config("DB_HEALTH_CHECKS", default=True, cast=bool)
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -94,12 +104,50 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default="postgres"),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
-        "ATOMIC_REQUESTS": True,
-        "CONN_MAX_AGE": 600,
-        "OPTIONS": {"connect_timeout": 10},
+        "ATOMIC_REQUESTS": False,
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": DB_HEALTH_CHECKS,
+        "OPTIONS": {
+            "connect_timeout": 10,
+            "pool": {
+                "name": f"{PROCESS_TYPE}-default",
+                "min_size": DB_POOL_MIN_SIZE,
+                "max_size": DB_POOL_MAX_SIZE,
+                "timeout": DB_POOL_TIMEOUT,
+                "max_waiting": DB_POOL_MAX_WAITING,
+                "max_idle": DB_POOL_MAX_IDLE,
+                "max_lifetime": DB_POOL_MAX_LIFETIME,
+            },
+        },
     }
 }
 
+DB_REPLICA_HOSTS = config(
+    "DB_REPLICA_HOSTS",
+    default="",
+    cast=lambda v: [s.strip() for s in v.split(",") if s.strip()],
+)
+DB_REPLICA_STICKY_SECONDS = config("DB_REPLICA_STICKY_SECONDS", default=10, cast=int)
+
+for _index, _replica_host in enumerate(DB_REPLICA_HOSTS):
+    _host, _, _port = _replica_host.partition(":")
+    DATABASES[f"replica{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "PORT": _port or DATABASES["default"]["PORT"],
+        "OPTIONS": {
+            **DATABASES["default"]["OPTIONS"],
+            "pool": {
+                **DATABASES["default"]["OPTIONS"]["pool"],
+                "name": f"{PROCESS_TYPE}-replica{_index}",
+            },
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["household_manager.db_router.ReplicaRouter"]
+
 AUTH_USER_MODEL = "users.User"
 
 AUTH_PASSWORD_HASHERS = [
@@ -129,6 +177,14 @@ SIMPLE_JWT = {
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
 }
 
+AUTH_PRINCIPAL_CACHE_TIMEOUT = config("AUTH_PRINCIPAL_CACHE_TIMEOUT", default=300, cast=int)
+AUTH_PRINCIPAL_LOCAL_TTL = config("AUTH_PRINCIPAL_LOCAL_TTL", default=15, cast=int)
+AUTH_PRINCIPAL_LOCAL_MAXSIZE = config("AUTH_PRINCIPAL_LOCAL_MAXSIZE", default=10000, cast=int)
+
+FAMILY_ACL_CACHE_TIMEOUT = config("FAMILY_ACL_CACHE_TIMEOUT", default=300, cast=int)
+FAMILY_ACL_LOCAL_TTL = config("FAMILY_ACL_LOCAL_TTL", default=60, cast=int)
+FAMILY_ACL_VERSION_LOCAL_TTL = config("FAMILY_ACL_VERSION_LOCAL_TTL", default=2, cast=int)
+
 LANGUAGE_CODE = "ru-RU"
 TIME_ZONE = "Europe/Moscow"
 USE_I18N = True
@@ -141,6 +197,8 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+DATA_UPLOAD_MAX_MEMORY_SIZE = config("DATA_UPLOAD_MAX_MEMORY_SIZE", default=10 * 1024 * 1024, cast=int)
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REDIS_HOST = config("REDIS_HOST", default="localhost")
@@ -164,6 +222,8 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=60 * 60, cast=int)
+
 CELERY_BROKER_URL = config("CELERY_BROKER_URL", default=f"redis://{REDIS_HOST}:{REDIS_PORT}/1")
 CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND", default=f"redis://{REDIS_HOST}:{REDIS_PORT}/2")
 CELERY_ACCEPT_CONTENT = ["application/json"]
@@ -184,6 +244,9 @@ CHANNEL_LAYERS = {
     },
 }
 
+FAMILY_EVENTS_BATCH_WINDOW_MS = config("FAMILY_EVENTS_BATCH_WINDOW_MS", default=250, cast=int)
+FAMILY_EVENTS_MAX_BATCH = config("FAMILY_EVENTS_MAX_BATCH", default=200, cast=int)
+
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS",
     default="http://localhost:3000,http://localhost:8080",
@@ -201,6 +264,15 @@ DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default=EMAIL_HOST_USER)
 
 TELEGRAM_BOT_TOKEN = config("TELEGRAM_BOT_TOKEN", default="")
 TELEGRAM_WEBHOOK_URL = config("TELEGRAM_WEBHOOK_URL", default="")
+TELEGRAM_WEBHOOK_SECRET = config("TELEGRAM_WEBHOOK_SECRET", default="")
+TELEGRAM_UPDATE_DEDUP_TTL = config("TELEGRAM_UPDATE_DEDUP_TTL", default=86400, cast=int)
+TELEGRAM_API_URL = config("TELEGRAM_API_URL", default="https://api.telegram.org")
+TELEGRAM_REQUEST_TIMEOUT = config("TELEGRAM_REQUEST_TIMEOUT", default=10, cast=int)
+TELEGRAM_RATE_LIMIT = config("TELEGRAM_RATE_LIMIT", default=25, cast=int)
+TELEGRAM_BURST = config("TELEGRAM_BURST", default=30, cast=int)
+
+NOTIFICATIONS_BATCH_SIZE = config("NOTIFICATIONS_BATCH_SIZE", default=100, cast=int)
+NOTIFICATIONS_SPREAD_WINDOW = config("NOTIFICATIONS_SPREAD_WINDOW", default=1800, cast=int)
 
 SENTRY_DSN = config("SENTRY_DSN", default="")
 if SENTRY_DSN:
@@ -229,12 +301,40 @@ LOGGING = {
     "root": {"handlers": ["console"], "level": config("LOG_LEVEL", default="INFO")},
 }
 
+EXPENSES_BULK_MAX_ITEMS = config("EXPENSES_BULK_MAX_ITEMS", default=10000, cast=int)
+EXPENSES_BULK_BATCH_SIZE = config("EXPENSES_BULK_BATCH_SIZE", default=2000, cast=int)
+EXPENSES_EXPORT_CHUNK_SIZE = config("EXPENSES_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
+ANALYTICS_INSIGHTS_CACHE_TIMEOUT = config("ANALYTICS_INSIGHTS_CACHE_TIMEOUT", default=24 * 60 * 60, cast=int)
+
+BUDGET_COUNTER_TIMEOUT = config("BUDGET_COUNTER_TIMEOUT", default=24 * 60 * 60, cast=int)
+BUDGET_COUNTER_FILL_TIMEOUT = config("BUDGET_COUNTER_FILL_TIMEOUT", default=60, cast=int)
+
 TESSERACT_CMD = config("TESSERACT_CMD", default="/usr/bin/tesseract")
 TESSERACT_LANG = config("TESSERACT_LANG", default="rus+eng")
+OCR_MAX_WORKERS = config("OCR_MAX_WORKERS", default=4, cast=int)
+OCR_MAX_WIDTH = config("OCR_MAX_WIDTH", default=1200, cast=int)
+OCR_LINES_PER_REGION = config("OCR_LINES_PER_REGION", default=8, cast=int)
+OCR_PHASH_MAX_DISTANCE = config("OCR_PHASH_MAX_DISTANCE", default=3, cast=int)
+OCR_CLAIM_TIMEOUT = config("OCR_CLAIM_TIMEOUT", default=CELERY_TASK_TIME_LIMIT, cast=int)
+RECEIPTS_MAX_UPLOAD_SIZE = config("RECEIPTS_MAX_UPLOAD_SIZE", default=20 * 1024 * 1024, cast=int)
+RECEIPTS_RETENTION_DAYS = config("RECEIPTS_RETENTION_DAYS", default=90, cast=int)
 
 ML_MODEL_PATH = BASE_DIR / "ml_models" / "category_classifier.joblib"
-ML_VECTORIZER_PATH = BASE_DIR / "ml_models" / "tfidf_vectorizer.joblib"
+ML_VECTORIZER_PATH = BASE_DIR / "ml_models" / "hashing_vectorizer.joblib"
 ML_RETRAIN_HOUR = config("ML_RETRAIN_HOUR", default=3, cast=int)
+ML_MIN_CONFIDENCE = config("ML_MIN_CONFIDENCE", default=0.5, cast=float)
+ML_BATCH_WINDOW_MS = config("ML_BATCH_WINDOW_MS", default=5, cast=int)
+ML_PREDICT_BATCH_SIZE = config("ML_PREDICT_BATCH_SIZE", default=512, cast=int)
+ML_CATEGORIZE_CHUNK_SIZE = config("ML_CATEGORIZE_CHUNK_SIZE", default=1000, cast=int)
+ML_MERCHANT_INDEX_TIMEOUT = config("ML_MERCHANT_INDEX_TIMEOUT", default=7 * 24 * 60 * 60, cast=int)
+ML_MERCHANT_INDEX_LOCAL_TTL = config("ML_MERCHANT_INDEX_LOCAL_TTL", default=60, cast=int)
+ML_MERCHANT_INDEX_LOCAL_MAXSIZE = config("ML_MERCHANT_INDEX_LOCAL_MAXSIZE", default=50000, cast=int)
+ML_MODEL_CHECK_INTERVAL = config("ML_MODEL_CHECK_INTERVAL", default=10, cast=int)
+ML_TRAINING_CHUNK_SIZE = config("ML_TRAINING_CHUNK_SIZE", default=5000, cast=int)
+ML_TRAINING_COMMIT_MARGIN = config("ML_TRAINING_COMMIT_MARGIN", default=5 * 60, cast=int)
+ML_TRAINING_LOCK_TIMEOUT = config("ML_TRAINING_LOCK_TIMEOUT", default=60 * 60, cast=int)
+ML_FULL_RETRAIN_INTERVAL_DAYS = config("ML_FULL_RETRAIN_INTERVAL_DAYS", default=30, cast=int)
 
 GOOGLE_SHEETS_CREDENTIALS_PATH = BASE_DIR / "credentials" / "google-sheets-key.json"
 
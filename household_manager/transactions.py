@@ -0,0 +1,23 @@
+from functools import wraps
+
+from django.db import transaction
+from ninja.decorators import decorate_view
+
+from .db_router import pin_to_primary
+
+
+def atomic_route(using=None):
+    def decorator(run):
+        @wraps(run)
+        def wrapper(request, *args, **kwargs):
+            with transaction.atomic(using=using):
+                response = run(request, *args, **kwargs)
+                if response.status_code >= 400:
+                    transaction.set_rollback(True, using=using)
+                else:
+                    pin_to_primary(getattr(request.auth, "id", None))
+            return response
+
+        return wrapper
+
+    return decorate_view(decorator)
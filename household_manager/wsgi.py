@@ -2,6 +2,10 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from household_manager.metrics import register_db_pool_metrics
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "household_manager.settings")
 
 application = get_wsgi_application()
+
+register_db_pool_metrics()